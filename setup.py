@@ -15,7 +15,7 @@ long_description = readme_path.read_text(encoding="utf-8") if readme_path.exists
 # Read requirements
 requirements = [
     "faster-whisper>=0.10.0",
-    "transformers>=4.21.0",
+    "transformers>=4.26.0",
     "sentencepiece>=0.1.99",
     "torch>=1.13.0",
 ]
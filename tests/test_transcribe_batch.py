@@ -7,6 +7,12 @@ import tempfile
 import os
 import sys
 import argparse
+from collections import namedtuple
+import subprocess
+import signal
+import time
+import threading
+from unittest import mock
 
 # Add the parent directory to the Python path so we can import transcribe_batch
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -16,11 +22,31 @@ try:
     from transcribe_batch import (
         srt_timestamp,
         outputs_present,
+        completed_outputs,
+        output_dirs,
         ensure_dirs,
+        write_artifacts,
+        CaptionWriter,
+        transcribe_with_feedback,
+        fixed_clips,
+        _chunk,
+        summarize_text,
+        _load_summarizer,
         build_parser,
+        controller,
         print_banner,
         Colors,
         get_config_path,
+        WorkerProcess,
+        WORKER_READY,
+        WORKER_DONE,
+        WORKER_BEAT,
+        Heartbeat,
+        process_file,
+        audio_cache_path,
+        split_gpus,
+        main,
+        worker,
     )
     IMPORTS_AVAILABLE = True
 except ImportError as e:
@@ -70,6 +96,48 @@ class TestTranscribeBatch(unittest.TestCase):
             # Create both required files
             (output_dir / "summary.md").write_text("test")
             self.assertTrue(outputs_present(output_dir))
+            # Checking is read-only; the controller adopts them when it skips
+            self.assertFalse((output_dir / ".done").exists())
+            (Path(temp_dir) / "unfinished").mkdir()
+            self.assertEqual(completed_outputs(Path(temp_dir)), {"test_output"})
+            vid = Path(temp_dir) / "test_output.mp4"
+            vid.write_bytes(b"")
+            args = argparse.Namespace(retries=0, timeout=0, trim_silence=False)
+            with mock.patch("builtins.print"):
+                self.assertEqual(process_file(args, None, vid, output_dir, "[1/1]", {"test_output"}), "skipped")
+            self.assertTrue((output_dir / ".done").exists())
+
+    def test_worker_overwrite_redoes_finished_file(self):
+        """Test that an explicit overwrite is not skipped by the worker"""
+        Info = namedtuple("Info", "duration language")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            vid = Path(temp_dir) / "talk.mp4"
+            vid.write_bytes(b"")
+            out_dir = Path(temp_dir) / "talk"
+            out_dir.mkdir()
+            (out_dir / "transcript.txt").write_text("old")
+            (out_dir / "summary.md").write_text("old")
+            args = argparse.Namespace(
+                input_file=str(vid), out_dir=str(out_dir), overwrite=True, trim_silence=False,
+                language="auto", beam=1, progress_timeout=0, batch_size=0, summarizer="none",
+                summary_max=8, summary_model="m", summary_backend="torch", cpu_threads=0)
+            with mock.patch("transcribe_batch.decode_to_f32", return_value=[]), \
+                 mock.patch("transcribe_batch.transcribe_with_feedback",
+                            return_value=([], "new text", Info(1.0, "en"))) as transcribe, \
+                 mock.patch("builtins.print"):
+                self.assertEqual(worker(args, model=object()), 0)
+            transcribe.assert_called_once()
+            self.assertEqual((out_dir / "full.txt").read_text(), "new text")
+
+    def test_output_dirs_keep_extension_on_shared_stem(self):
+        """Test that talk.mp4 and talk.m4a get separate output folders"""
+        root = Path("out")
+        files = [Path("in/talk.m4a"), Path("in/talk.mp4"), Path("in/my talk.mkv")]
+        self.assertEqual(output_dirs(root, files), {
+            files[0]: root / "talk.m4a",
+            files[1]: root / "talk.mp4",
+            files[2]: root / "my_talk",
+        })
 
     def test_ensure_dirs(self):
         """Test directory creation"""
@@ -88,6 +156,108 @@ class TestTranscribeBatch(unittest.TestCase):
             ensure_dirs(test_dir)
             self.assertTrue(test_dir.exists())
 
+    def test_write_artifacts(self):
+        """Test transcript and caption file contents"""
+        segments = [(0.0, 1.5, " Hello"), (61.25, 62.0, "world ")]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_dir = Path(temp_dir)
+            write_artifacts(out_dir, segments, "Hello world", "clip", do_summary=False, summary_max=8)
+
+            self.assertEqual(
+                (out_dir / "transcript.txt").read_text(encoding="utf-8"),
+                "[00:00:00,000 - 00:00:01,500]  Hello\n[00:01:01,250 - 00:01:02,000] world \n",
+            )
+            self.assertEqual(
+                (out_dir / "captions.srt").read_text(encoding="utf-8"),
+                "1\n00:00:00,000 --> 00:00:01,500\nHello\n\n2\n00:01:01,250 --> 00:01:02,000\nworld\n\n",
+            )
+            self.assertEqual(
+                (out_dir / "captions.vtt").read_text(encoding="utf-8"),
+                "WEBVTT\n\n00:00:00.000 --> 00:00:01.500\nHello\n\n00:01:01.250 --> 00:01:02.000\nworld\n\n",
+            )
+            self.assertEqual((out_dir / "full.txt").read_text(encoding="utf-8"), "Hello world")
+            self.assertTrue((out_dir / "summary.md").exists())
+
+    def test_transcribe_streams_to_writer(self):
+        """Test that segments are written as they arrive instead of being returned"""
+        Segment = namedtuple("Segment", "start end text")
+        Info = namedtuple("Info", "duration language")
+
+        class FakeModel:
+            def transcribe(self, path, **kwargs):
+                segs = [Segment(0.0, 2.0, " One."), Segment(2.0, 4.0, " Two.")]
+                return iter(segs), Info(4.0, "en")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_dir = Path(temp_dir)
+            with CaptionWriter(out_dir) as captions:
+                segments, full_text, _ = transcribe_with_feedback(
+                    FakeModel(), Path("clip.mp4"), "auto", 1, 0, writer=captions)
+
+            self.assertEqual(segments, [])
+            self.assertEqual(full_text, "One. Two.")
+            self.assertEqual(captions.count, 2)
+            self.assertIn("2\n00:00:02,000 --> 00:00:04,000\nTwo.", (out_dir / "captions.srt").read_text(encoding="utf-8"))
+
+    def test_batched_without_vad_gets_clip_windows(self):
+        """Test that a batched pipeline without VAD is given fixed 30 s windows"""
+        Info = namedtuple("Info", "duration language")
+        seen = {}
+
+        class FakePipeline:
+            def transcribe(self, audio, **kwargs):
+                seen.update(kwargs)
+                return iter([]), Info(len(audio) / 16000, "en")
+
+        self.assertEqual(fixed_clips(65.0), [{"start": 0.0, "end": 30.0}, {"start": 30.0, "end": 60.0},
+                                             {"start": 60.0, "end": 65.0}])
+        self.assertEqual(fixed_clips(60.0), [{"start": 0.0, "end": 30.0}, {"start": 30.0, "end": 60.0}])
+        audio = [0.0] * (16000 * 45)
+        # The pipeline may come from the caller, not load_whisper (see examples/)
+        fake_fw = mock.MagicMock(BatchedInferencePipeline=FakePipeline)
+        with mock.patch.dict(sys.modules, {"faster_whisper": fake_fw}), \
+             mock.patch("transcribe_batch._WM", None):
+            transcribe_with_feedback(FakePipeline(), audio, "auto", 1, 0, batch_size=8, vad_filter=False)
+        self.assertEqual(seen["clip_timestamps"], [{"start": 0.0, "end": 30.0}, {"start": 30.0, "end": 45.0}])
+        self.assertEqual(seen["batch_size"], 8)
+        self.assertIs(seen["without_timestamps"], False)
+
+    def test_chunk_sentences(self):
+        """Test sentence-preserving text chunking"""
+        self.assertEqual(_chunk(" Short text. ", 100), ["Short text."])
+        text = "One two. Three four! Five six? Seven."
+        self.assertEqual(_chunk(text, 20), ["One two. Three four!", "Five six? Seven."])
+        # A sentence longer than the limit becomes its own chunk
+        self.assertEqual(_chunk("Tiny. " + "x" * 30 + ". End.", 10), ["Tiny.", "x" * 30 + ".", "End."])
+
+    def test_short_transcript_summary(self):
+        """Test short transcripts are summarized extractively without a model"""
+        text = "Budgets matter. The budget review covers budget cuts. Lunch was fine. Budget cuts start soon."
+        self.assertEqual(summarize_text(text, max_sentences=2),
+                         ["The budget review covers budget cuts.", "Budget cuts start soon."])
+        self.assertEqual(summarize_text("Just one line", max_sentences=3), ["Just one line"])
+
+    def test_ct2_summarizer_uses_worker_threads(self):
+        """Test that the ct2 summarizer runs on the worker's share of cores"""
+        ct2 = mock.MagicMock()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / "summary-m-int8").mkdir()
+            (Path(temp_dir) / "summary-m-int8" / "model.bin").touch()
+            with mock.patch.dict(sys.modules, {"ctranslate2": ct2, "transformers": mock.MagicMock()}), \
+                 mock.patch("transcribe_batch.get_model_cache_dir", return_value=Path(temp_dir)), \
+                 mock.patch("transcribe_batch.cuda_device_count", return_value=0), \
+                 mock.patch("transcribe_batch._summ", None), mock.patch("transcribe_batch._summ_model", None):
+                _load_summarizer("m", "ct2", cpu_threads=3)
+        self.assertEqual(ct2.Translator.call_args.kwargs["intra_threads"], 3)
+
+    def test_split_gpus(self):
+        """Test round-robin GPU assignment for parallel workers"""
+        with mock.patch("transcribe_batch.cuda_device_count", return_value=0):
+            self.assertEqual(split_gpus(3), [])
+        with mock.patch("transcribe_batch.cuda_device_count", return_value=2), \
+             mock.patch.dict(os.environ, {"CUDA_VISIBLE_DEVICES": "4,6"}):
+            self.assertEqual(split_gpus(3), ["4", "6", "4"])
+
     def test_argument_parser(self):
         """Test argument parser configuration"""
         parser = build_parser()
@@ -112,6 +282,179 @@ class TestTranscribeBatch(unittest.TestCase):
         # Should contain 'video-transcribe' in the path
         self.assertIn("video-transcribe", str(config_path))
 
+class TestWorkerProcess(unittest.TestCase):
+    """Tests for the persistent worker supervisor using a fake worker script"""
+
+    def setUp(self):
+        if not IMPORTS_AVAILABLE:
+            self.skipTest("Required imports not available")
+
+    def fake_worker(self, body):
+        script = (
+            "import json, sys, time\n"
+            "settings = json.loads(sys.stdin.readline())\n"
+            f"print({WORKER_READY!r}, flush=True)\n"
+            "for line in sys.stdin:\n"
+            "    job = json.loads(line)\n"
+            f"{body}"
+        )
+        return WorkerProcess([sys.executable, "-c", script], settings={"model": "tiny"}, progress_timeout=1)
+
+    def test_reuses_process_across_files(self):
+        """Test that several files are handled by one worker process"""
+        proc = self.fake_worker(f"    print({WORKER_DONE!r} + ' 0', flush=True)\n")
+        try:
+            self.assertEqual(proc.run(Path("a.mp4"), Path("out/a")), 0)
+            pid = proc.proc.pid
+            self.assertEqual(proc.run(Path("b.mp4"), Path("out/b")), 0)
+            self.assertEqual(proc.proc.pid, pid)
+        finally:
+            proc.close()
+
+    def test_stall_kills_and_respawns(self):
+        """Test that a silent worker is killed and a fresh one is started"""
+        proc = self.fake_worker("    time.sleep(30)\n")
+        try:
+            with self.assertRaises(subprocess.TimeoutExpired):
+                proc.run(Path("a.mp4"), Path("out/a"))
+            self.assertIsNone(proc.proc)
+        finally:
+            proc.close()
+
+    def test_heartbeat_stops_after_limit(self):
+        """Test that beats stop after the limit so a native-code hang still stalls"""
+        import io
+        out = io.StringIO()
+        with mock.patch("sys.stdout", out), Heartbeat(0.05, limit=0.2):
+            time.sleep(0.6)  # about 12 beats without the limit
+        self.assertIn(out.getvalue().count(WORKER_BEAT), range(1, 6))
+
+    def test_hung_model_load_times_out(self):
+        """Test that a worker that never becomes ready is killed"""
+        proc = WorkerProcess([sys.executable, "-c", "import time; time.sleep(30)"], progress_timeout=1)
+        try:
+            with mock.patch("transcribe_batch.WORKER_LOAD_TIMEOUT", 1), \
+                 self.assertRaises(subprocess.TimeoutExpired):
+                proc.run(Path("a.mp4"), Path("out/a"))
+            self.assertIsNone(proc.proc)
+        finally:
+            proc.close()
+
+    def test_heartbeat_keeps_silent_worker_alive(self):
+        """Test that heartbeat lines count as activity and are not forwarded"""
+        proc = self.fake_worker(
+            "    for _ in range(6):\n"
+            "        time.sleep(0.4)\n"
+            f"        print({WORKER_BEAT!r}, flush=True)\n"
+            f"    print({WORKER_DONE!r} + ' 0', flush=True)\n"
+        )
+        try:
+            with mock.patch("builtins.print") as printed:
+                self.assertEqual(proc.run(Path("a.mp4"), Path("out/a")), 0)
+            self.assertFalse(any(WORKER_BEAT in str(c) for c in printed.call_args_list))
+        finally:
+            proc.close()
+
+    def test_failed_file_drops_audio_cache(self):
+        """Test that the decoded audio is deleted once retries are exhausted"""
+        class FailingWorker:
+            cmd = ["serve"]
+
+            def run(self, vid, out_dir, timeout=0, prefix=""):
+                return 99
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            vid = Path(temp_dir) / "talk.mp4"
+            vid.write_bytes(b"media")
+            cache = audio_cache_path(vid)
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            cache.write_bytes(b"audio")
+            args = argparse.Namespace(retries=0, timeout=0, trim_silence=False)
+            with mock.patch("builtins.print"):
+                result = process_file(args, FailingWorker(), vid, Path(temp_dir) / "talk", "[1/1]", set())
+            self.assertEqual(result, "failed")
+            self.assertFalse(cache.exists())
+
+
+class TestInteractiveRun(unittest.TestCase):
+    """The wizard path runs the batch controller without any subcommand defaults"""
+
+    def setUp(self):
+        if not IMPORTS_AVAILABLE:
+            self.skipTest("Required imports not available")
+
+    def test_interactive_run_reaches_workers(self):
+        jobs = []
+
+        class FakeWorker:
+            def __init__(self, cmd, settings=None, progress_timeout=0, env=None):
+                self.settings = settings
+
+            def run(self, vid, out_dir, timeout=0, prefix=""):
+                jobs.append((vid.name, self.settings))
+                return 0
+
+            def close(self):
+                pass
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            in_dir = Path(temp_dir) / "in"
+            in_dir.mkdir()
+            (in_dir / "talk.mp4").write_bytes(b"")
+            config = {"input": str(in_dir), "output": str(Path(temp_dir) / "out"),
+                      "model": "tiny", "language": "auto", "summarizer": "none"}
+            with mock.patch.object(sys, "argv", ["video-transcribe", "--interactive"]), \
+                 mock.patch("transcribe_batch.interactive_setup", return_value=config), \
+                 mock.patch("transcribe_batch.validate_dependencies", return_value=True), \
+                 mock.patch("transcribe_batch.WorkerProcess", FakeWorker):
+                main()
+        self.assertEqual([name for name, _ in jobs], ["talk.mp4"])
+        self.assertEqual(jobs[0][1]["model"], "tiny")
+
+    def test_ctrl_c_stops_parallel_run(self):
+        """Test that Ctrl+C cancels queued files and running ones are not retried"""
+        jobs = []
+        killed = threading.Event()
+
+        class FakeWorker:
+            cmd = ["serve"]
+
+            def __init__(self, cmd, settings=None, progress_timeout=0, env=None):
+                pass
+
+            def run(self, vid, out_dir, timeout=0, prefix=""):
+                jobs.append(vid.name)
+                if killed.is_set():
+                    return 0
+                if len(jobs) == 1:
+                    threading.Timer(0.2, ctrl_c).start()
+                killed.wait(5)
+                return -signal.SIGINT  # Ctrl+C reaches the whole process group
+
+            def abort(self):
+                pass
+
+            def close(self):
+                pass
+
+        def ctrl_c():
+            killed.set()
+            os.kill(os.getpid(), signal.SIGINT)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            in_dir = Path(temp_dir) / "in"
+            in_dir.mkdir()
+            for i in range(6):
+                (in_dir / f"talk{i}.mp4").write_bytes(b"")
+            args = build_parser().parse_args(
+                ["run", "--input", str(in_dir), "--output", str(Path(temp_dir) / "out"), "--parallel", "2"])
+            with mock.patch("transcribe_batch.WorkerProcess", FakeWorker), \
+                 mock.patch("builtins.print"):
+                with self.assertRaises(KeyboardInterrupt):
+                    controller(args)
+        self.assertEqual(len(jobs), 2)
+
+
 class TestBasicFunctionality(unittest.TestCase):
     """Tests that don't require full imports"""
     
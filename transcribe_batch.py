@@ -28,15 +28,22 @@ Batch transcribe MP4 files with OpenAI Whisper + Facebook BART AI Summary
 """
 
 import argparse
+import io
 import json
 import os
 import re
 import subprocess
 import sys
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# Precompiled patterns
+_SENT = re.compile(r"(?<=[.!?])\s+")
+_SAFE = re.compile(r"[^A-Za-z0-9._-]")
+_WORD = re.compile(r"\w+")
+
 # Console styling
 class Colors:
     """ANSI color codes for console output"""
@@ -61,9 +68,9 @@ class Colors:
 if not sys.stdout.isatty() or os.getenv('NO_COLOR'):
     Colors.disable()
 
-def print_banner():
-    """Print a nice banner for the application"""
-    banner = f"""
+def banner_text() -> str:
+    """The application banner (built per call so --no-color applies)"""
+    return f"""
 {Colors.CYAN}{Colors.BOLD}
 ╔════════════════════════════════════════════════════════════════╗
 ║                   🎥 Video Transcription Tool                  ║
@@ -72,57 +79,249 @@ def print_banner():
 {Colors.END}
 {Colors.BLUE}Powered by OpenAI Whisper + Facebook BART{Colors.END}
 """
-    print(banner)
+
+def print_banner():
+    """Print a nice banner for the application"""
+    print(banner_text())
 
 # --------------------------- formatting ---------------------------
 
+def _to_ms(t: float) -> int:
+    """Seconds to whole milliseconds, truncating the fraction"""
+    whole = int(t)
+    return whole * 1000 + int((t - whole) * 1000)
+
+def _fmt(ms: int, sep: str) -> str:
+    """Format integer milliseconds as HH:MM:SS<sep>mmm"""
+    h, r = divmod(ms, 3_600_000)
+    m, r = divmod(r, 60_000)
+    s, ms = divmod(r, 1000)
+    return f"{h:02d}:{m:02d}:{s:02d}{sep}{ms:03d}"
+
 def srt_timestamp(t: float) -> str:
-    h = int(t // 3600); m = int((t % 3600) // 60); s = int(t % 60); ms = int((t - int(t)) * 1000)
-    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+    return _fmt(_to_ms(t), ",")
 
 # --------------------------- summarization ---------------------------
 
+DEFAULT_SUMMARY_MODEL = "sshleifer/distilbart-cnn-12-6"
+
+class _CT2Summarizer:
+    """
+    Pipeline-compatible summarizer running an int8 CTranslate2 copy of the model.
+    The copy is converted once into the model cache; generation settings
+    (beams, length penalty, n-gram blocking) come from the model's own config.
+    """
+    def __init__(self, model: str, cpu_threads: int = 0):
+        import ctranslate2
+        from transformers import AutoTokenizer, GenerationConfig
+        out_dir = get_model_cache_dir() / f"summary-{_SAFE.sub('_', model)}-int8"
+        if not (out_dir / "model.bin").exists():
+            print(f"    🔧 Converting {model} to int8 (one-time)...", flush=True)
+            ctranslate2.converters.TransformersConverter(model).convert(
+                str(out_dir), quantization="int8", force=True)
+        device = "cuda" if cuda_device_count() > 0 else "cpu"
+        self.translator = ctranslate2.Translator(
+            str(out_dir), device=device, compute_type="int8_float16" if device == "cuda" else "int8",
+            intra_threads=cpu_threads or os.cpu_count() or 0)
+        self.tokenizer = AutoTokenizer.from_pretrained(model)
+        gen = GenerationConfig.from_pretrained(model)
+        self.beam_size = gen.num_beams or 1
+        self.length_penalty = gen.length_penalty
+        self.no_repeat_ngram_size = gen.no_repeat_ngram_size or 0
+
+    def __call__(self, texts, max_length: int = 128, min_length: int = 40, do_sample: bool = False,
+                 batch_size: int = 8, truncation: bool = True):
+        if isinstance(texts, str):
+            texts = [texts]
+        tok = self.tokenizer
+        limit = tok.model_max_length if truncation else None
+        sources = [tok.convert_ids_to_tokens(tok.encode(t, truncation=truncation, max_length=limit))
+                   for t in texts]
+        results = self.translator.translate_batch(
+            sources, max_batch_size=batch_size, beam_size=self.beam_size,
+            length_penalty=self.length_penalty, no_repeat_ngram_size=self.no_repeat_ngram_size,
+            max_decoding_length=max_length, min_decoding_length=min_length)
+        return [{"summary_text": tok.decode(tok.convert_tokens_to_ids(r.hypotheses[0]), skip_special_tokens=True)}
+                for r in results]
+
 _summ = None
-def _load_summarizer():
-    global _summ
-    from transformers import pipeline
-    _summ = pipeline("summarization", model="facebook/bart-large-cnn", device_map="auto")
+_summ_model = None
+def _load_summarizer(model: str = DEFAULT_SUMMARY_MODEL, backend: str = "torch", cpu_threads: int = 0):
+    """
+    Load the summarizer once per process. The torch backend int8-quantizes
+    linear layers on CPU; the ct2 backend runs an int8 CTranslate2 copy
+    on cpu_threads threads (0 = every core), like load_whisper.
+    """
+    global _summ, _summ_model
+    if backend == "ct2":
+        _summ = _CT2Summarizer(model, cpu_threads)
+    else:
+        from transformers import pipeline
+        _summ = pipeline("summarization", model=model, device_map="auto")
+        if _summ.device.type == "cpu":
+            import torch
+            _summ.model = torch.quantization.quantize_dynamic(_summ.model, {torch.nn.Linear}, dtype=torch.qint8)
+    _summ_model = (model, backend)
 
 def _chunk(text: str, max_chars: int = 3500):
-    import re as _re
-    text = _re.sub(r"\s+", " ", text).strip()
+    """
+    Split text into chunks of whole sentences, sliced from text in one scan.
+    Expects single-spaced text, which transcribe_with_feedback guarantees by
+    normalizing each segment, so the full transcript is never re-copied here.
+    """
+    text = text.strip()
     if len(text) <= max_chars: return [text]
-    sents = _re.split(r"(?<=[.!?])\s+", text)
-    chunks, cur = [], ""
-    for s in sents:
-        if len(cur) + len(s) + 1 > max_chars and cur:
-            chunks.append(cur.strip()); cur = s
-        else:
-            cur = f"{cur} {s}" if cur else s
-    if cur: chunks.append(cur.strip())
+    # (end of sentence, start of the next) for every sentence boundary
+    bounds = [(m.start(), m.end()) for m in _SENT.finditer(text)]
+    bounds.append((len(text), len(text)))
+    chunks = []
+    start = sent = cut = 0  # chunk start, current sentence start, end of last sentence in chunk
+    for end, nxt in bounds:
+        if end - start > max_chars and cut > start:
+            chunks.append(text[start:cut])
+            start = sent
+        cut, sent = end, nxt
+    chunks.append(text[start:cut])
     return chunks
 
-def summarize_text(full_text: str, max_sentences: int = 8):
+def extractive_summary(text: str, max_sentences: int = 8):
+    """Pick the sentences with the most frequent content words, kept in original order"""
+    sents = [s.strip() for s in _SENT.split(text.strip()) if s.strip()]
+    if len(sents) <= max_sentences:
+        return sents
+    freq: Dict[str, int] = {}
+    for w in _WORD.findall(text.lower()):
+        if len(w) > 3:  # cheap stand-in for a stop-word list
+            freq[w] = freq.get(w, 0) + 1
+    def score(s: str) -> float:
+        words = _WORD.findall(s.lower())
+        return sum(freq.get(w, 0) for w in words) / (len(words) or 1)
+    best = sorted(range(len(sents)), key=lambda i: score(sents[i]), reverse=True)[:max_sentences]
+    return [sents[i] for i in sorted(best)]
+
+SHORT_TRANSCRIPT_WORDS = 150
+
+def summarize_text(full_text: str, max_sentences: int = 8, model: str = DEFAULT_SUMMARY_MODEL,
+                   backend: str = "torch", cpu_threads: int = 0):
     if not full_text.strip(): return []
-    if _summ is None: _load_summarizer()
-    first = []
-    for c in _chunk(full_text, 3500):
-        first.append(_summ(c, max_length=128, min_length=40, do_sample=False)[0]["summary_text"])
-    merged = " ".join(first)
-    out2 = _summ(merged, max_length=128, min_length=40, do_sample=False)[0]["summary_text"]
-    import re as _re
-    sents = [s.strip() for s in _re.split(r"(?<=[.!?])\s+", out2) if s.strip()]
+    # Short clips: sentence extraction gives about the same result without loading a model
+    if len(full_text.split()) < SHORT_TRANSCRIPT_WORDS:
+        return extractive_summary(full_text, max_sentences)
+    if _summ is None or _summ_model != (model, backend): _load_summarizer(model, backend, cpu_threads)
+    # One pipeline call over all chunks lets the model batch them
+    max_length = 128
+    outs = _summ(_chunk(full_text, 3500), max_length=max_length, min_length=40, do_sample=False,
+                 batch_size=8, truncation=True)
+    merged = " ".join(o["summary_text"] for o in outs)
+    # The merge pass only helps when the first-pass summaries together exceed one summary's length
+    if len(outs) == 1 or len(_summ.tokenizer(merged).input_ids) <= max_length:
+        out2 = merged
+    else:
+        out2 = _summ(merged, max_length=max_length, min_length=40, do_sample=False)[0]["summary_text"]
+    sents = [s.strip() for s in _SENT.split(out2) if s.strip()]
     return sents[:max_sentences]
 
 # --------------------------- whisper ---------------------------
 
+def get_model_cache_dir() -> Path:
+    """Get the directory holding locally converted Whisper models"""
+    if os.name == 'posix':
+        cache_dir = os.getenv('XDG_CACHE_HOME', os.path.expanduser('~/.cache'))
+    else:
+        cache_dir = os.getenv('LOCALAPPDATA', os.path.expanduser('~'))
+    return Path(cache_dir) / 'video-transcribe' / 'models'
+
+def ensure_converted_model(model_size: str, compute_type: str) -> Path:
+    """
+    Convert openai/whisper-<size> to CTranslate2 with weights already quantized
+    to compute_type, once. Later loads map the packed weights directly instead
+    of re-quantizing them on every start.
+    """
+    out_dir = get_model_cache_dir() / f"{model_size}-{compute_type}"
+    if not (out_dir / "model.bin").exists():
+        from ctranslate2.converters import TransformersConverter
+        print(f"    🔧 Converting {model_size} to {compute_type} (one-time)...", flush=True)
+        out_dir.parent.mkdir(parents=True, exist_ok=True)
+        TransformersConverter(
+            f"openai/whisper-{model_size}",
+            copy_files=["tokenizer.json", "preprocessor_config.json"],
+        ).convert(str(out_dir), quantization=compute_type, force=True)
+    return out_dir
+
 _WM = None
-def load_whisper(model_size: str, compute_type: str):
+def load_whisper(model_size: str, compute_type: str, batch_size: int = 0,
+                 cpu_threads: int = 0, num_workers: int = 1, preconvert: bool = False):
+    """
+    Load a Whisper model, wrapped for batched inference when batch_size > 1.
+    cpu_threads=0 uses every core (CTranslate2 otherwise picks a small default).
+    preconvert loads a locally cached, pre-quantized copy (see ensure_converted_model).
+    compute_type "auto" resolves per device (see auto_compute_type).
+    """
     global _WM
     if _WM is None:
         from faster_whisper import WhisperModel as _WM_
         _WM = _WM_
-    return _WM(model_size, compute_type=compute_type)
+    compute_type = auto_compute_type(compute_type)
+    model_ref = model_size
+    if preconvert:
+        model_ref = str(ensure_converted_model(model_size, compute_type))
+    model = _WM(
+        model_ref,
+        device="auto",
+        compute_type=compute_type,
+        cpu_threads=cpu_threads or os.cpu_count() or 0,
+        num_workers=num_workers,
+    )
+    if batch_size > 1:
+        try:
+            from faster_whisper import BatchedInferencePipeline
+        except ImportError:  # faster-whisper < 1.1 has no batched pipeline
+            return model
+        return BatchedInferencePipeline(model=model)
+    return model
+
+def cuda_device_count() -> int:
+    """Number of CUDA devices visible to CTranslate2 (0 if it is not installed)"""
+    try:
+        import ctranslate2
+    except ImportError:
+        return 0
+    return ctranslate2.get_cuda_device_count()
+
+def auto_batch_size(batch_size: int) -> int:
+    """Resolve --batch-size 0 to a device default: 16 on GPU, 8 on CPU"""
+    if batch_size:
+        return batch_size
+    return 16 if cuda_device_count() > 0 else 8
+
+def auto_compute_type(compute_type: str = "auto") -> str:
+    """
+    Resolve --compute-type auto: float16 on GPU, int8 on CPU.
+    CTranslate2 picks the fastest int8 kernels (AVX-512 VNNI, AVX2, NEON) itself.
+    """
+    if compute_type != "auto":
+        return compute_type
+    return "float16" if cuda_device_count() > 0 else "int8"
+
+def describe_backend(cpu_threads: int = 0) -> str:
+    """One-line summary of the CTranslate2 threading/device setup"""
+    threads = cpu_threads or os.cpu_count()
+    return (f"CPU threads: {threads} | OMP_NUM_THREADS: {os.getenv('OMP_NUM_THREADS', 'unset')}"
+            f" | CUDA devices: {cuda_device_count()}")
+
+def worker_env(cpu_threads: int = 0) -> Dict[str, str]:
+    """
+    Environment for worker processes with OpenMP/MKL thread counts filled in.
+    Values already set by the user are kept unless --cpu-threads is explicit.
+    """
+    env = os.environ.copy()
+    threads = str(cpu_threads or os.cpu_count() or 1)
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        if cpu_threads:
+            env[var] = threads
+        else:
+            env.setdefault(var, threads)
+    return env
 
 def create_progress_bar(current: int, total: int, width: int = 30) -> str:
     """Create a simple progress bar"""
@@ -134,18 +333,109 @@ def create_progress_bar(current: int, total: int, width: int = 30) -> str:
     percentage = int(100 * current / total)
     return f"[{bar}] {percentage:3d}%"
 
-def transcribe_with_feedback(model, media_path: Path, language: str, beam_size: int, progress_timeout: int):
+def preprocess_audio(vid: Path, wav_path: Path) -> Path:
+    """
+    Decode to 16 kHz mono WAV with silent stretches cut out by ffmpeg.
+    Much cheaper than running Silero VAD inside Whisper, but caption
+    timestamps then follow the trimmed audio rather than the original video.
+    """
+    subprocess.run(
+        [
+            "ffmpeg", "-nostdin", "-y", "-v", "error",
+            "-i", str(vid),
+            "-ac", "1", "-ar", "16000",
+            "-af", "silenceremove=stop_periods=-1:stop_duration=0.4:stop_threshold=-35dB",
+            "-f", "wav", str(wav_path),
+        ],
+        check=True,
+    )
+    return wav_path
+
+def audio_cache_path(vid: Path, trimmed: bool = False) -> Path:
+    """Location of the decoded float32 audio for vid, keyed by path, size and mtime"""
+    import hashlib
+    import tempfile
+    st = vid.stat()
+    key = hashlib.sha1(f"{vid.resolve()}|{st.st_size}|{st.st_mtime_ns}|{trimmed}".encode()).hexdigest()[:16]
+    return Path(tempfile.gettempdir()) / "video-transcribe" / f"{key}.f32"
+
+def drop_audio_cache(vid: Path, trimmed: bool = False):
+    """Delete vid's decoded audio once no attempt will read it again"""
+    try:
+        audio_cache_path(vid, trimmed).unlink()
+    except OSError:
+        pass  # already gone, or still mapped (Windows); the temp dir gets cleaned eventually
+
+def decode_to_f32(source: Path, cache_path: Path):
+    """
+    Decode source to 16 kHz mono float32 once and memory-map the raw samples.
+    Retries (even in a respawned worker) map the cached file instead of
+    decoding the media again.
+    """
+    import numpy as np
+    if not cache_path.exists():
+        from faster_whisper import decode_audio
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        decode_audio(str(source), sampling_rate=16000).astype(np.float32, copy=False).tofile(tmp_path)
+        os.replace(tmp_path, cache_path)  # never leave a half-written cache behind
+    return np.memmap(cache_path, dtype=np.float32, mode="r")
+
+def _is_batched(model) -> bool:
+    """Whether model is a BatchedInferencePipeline, however it was built"""
+    try:
+        from faster_whisper import BatchedInferencePipeline
+    except ImportError:
+        return False
+    return isinstance(model, BatchedInferencePipeline)
+
+def fixed_clips(duration: float, window: float = 30.0) -> List[Dict[str, float]]:
+    """Consecutive clip_timestamps windows (seconds) covering duration"""
+    starts = [i * window for i in range(int(duration // window) + 1)]
+    return [{"start": t, "end": min(t + window, duration)} for t in starts if t < duration]
+
+def transcribe_with_feedback(model, media_path: Path, language: str, beam_size: int, progress_timeout: int,
+                             batch_size: int = 0, vad_filter: bool = True, writer: Optional["CaptionWriter"] = None):
     """
     Enhanced transcription with visual progress feedback.
     Streams segments and prints progress with time estimates.
     Aborts with RuntimeError if no new audio seconds for progress_timeout.
+    With a batched pipeline model, batch_size 30s windows are decoded together.
+    With a `writer`, segments go straight to it and the returned list is empty.
+    media_path may also be a decoded 16 kHz float32 array (see decode_to_f32).
     """
+    kwargs = {}
+    batched = _is_batched(model)
+    if batched and batch_size > 1:
+        kwargs["batch_size"] = batch_size
+    if batched and not vad_filter:
+        # The batched pipeline only finds its windows through VAD; without it,
+        # hand it fixed 30 s windows over the whole (e.g. silence-trimmed) audio
+        if isinstance(media_path, (str, Path)):
+            from faster_whisper import decode_audio
+            media_path = decode_audio(str(media_path), sampling_rate=16000)
+        kwargs["clip_timestamps"] = fixed_clips(len(media_path) / 16000)
+
     seg_iter, info = model.transcribe(
-        str(media_path),
+        str(media_path) if isinstance(media_path, (str, Path)) else media_path,
         language=None if language == "auto" else language,
         beam_size=beam_size,
-        vad_filter=True,
-        vad_parameters=dict(min_silence_duration_ms=400),
+        # A single temperature disables the fallback that silently re-decodes
+        # hard windows at higher temperatures
+        temperature=0.0,
+        best_of=1,
+        compression_ratio_threshold=2.4,
+        log_prob_threshold=-1.0,
+        no_speech_threshold=0.6,
+        condition_on_previous_text=False,
+        # The batched pipeline defaults to True, which yields one segment per
+        # merged VAD chunk (up to 30 s); keep per-sentence caption cues
+        without_timestamps=False,
+        word_timestamps=False,
+        vad_filter=vad_filter,
+        # Longer silences with tighter padding: fewer, shorter speech windows
+        vad_parameters=dict(min_silence_duration_ms=500, speech_pad_ms=200) if vad_filter else None,
+        **kwargs,
     )
     
     segments: List[Tuple[float, float, str]] = []
@@ -159,9 +449,12 @@ def transcribe_with_feedback(model, media_path: Path, language: str, beam_size:
     total_duration = getattr(info, 'duration', None)
 
     for seg in seg_iter:
-        text = seg.text.strip()
-        segments.append((seg.start, seg.end, text))
-        parts.append(text)
+        text = " ".join(seg.text.split())  # single-spaced, as _chunk expects
+        if writer is not None:
+            writer.add(seg.start, seg.end, text)
+        else:
+            segments.append((seg.start, seg.end, text))
+            parts.append(text)
 
         # Enhanced progress print every ~10s of audio
         bucket = int(seg.end) // 10
@@ -191,40 +484,102 @@ def transcribe_with_feedback(model, media_path: Path, language: str, beam_size:
             print(f"    ⚠️  No progress for {progress_timeout}s - aborting", flush=True)
             raise RuntimeError("progress-timeout")
 
-    return segments, " ".join(parts), info
+    full_text = writer.full_text if writer is not None else " ".join(parts)
+    return segments, full_text, info
 
 # --------------------------- helpers ---------------------------
 
+DONE_MARKER = ".done"
+
 def outputs_present(out_dir: Path) -> bool:
-    # Consider completed if both transcript and summary exist
+    # Completed once the sentinel is written after the last artifact (one stat)
+    if (out_dir / DONE_MARKER).exists():
+        return True
+    # Outputs from before the sentinel existed (the controller adopts them on skip)
     return (out_dir / "transcript.txt").exists() and (out_dir / "summary.md").exists()
 
-def ensure_dirs(out_dir: Path):
-    out_dir.mkdir(parents=True, exist_ok=True)
+def completed_outputs(out_root: Path) -> set:
+    """Names of finished output folders, from one scan of out_root"""
+    with os.scandir(out_root) as it:
+        return {e.name for e in it if e.is_dir() and outputs_present(Path(e.path))}
 
-def write_artifacts(out_dir: Path, segments: List[Tuple[float, float, str]], full_text: str, stem: str, do_summary: bool, summary_max: int):
-    # transcript.txt
-    with (out_dir / "transcript.txt").open("w", encoding="utf-8") as f:
-        for (start, end, text) in segments:
-            f.write(f"[{srt_timestamp(start)} - {srt_timestamp(end)}] {text}\n")
+def mark_done(out_dir: Path):
+    """Write the completion sentinel checked by outputs_present"""
+    (out_dir / DONE_MARKER).touch()
 
-    # captions.srt
-    with (out_dir / "captions.srt").open("w", encoding="utf-8") as f:
-        for i, (start, end, text) in enumerate(segments, 1):
-            f.write(f"{i}\n{srt_timestamp(start)} --> {srt_timestamp(end)}\n{text.strip()}\n\n")
+MEDIA_EXTS = (".mp4", ".mkv", ".m4a", ".mov", ".webm", ".avi")
 
-    # captions.vtt
-    with (out_dir / "captions.vtt").open("w", encoding="utf-8") as f:
-        f.write("WEBVTT\n\n")
-        for (start, end, text) in segments:
-            f.write(f"{srt_timestamp(start).replace(',', '.')} --> {srt_timestamp(end).replace(',', '.')}\n{text.strip()}\n\n")
+def find_media_files(in_dir: Path) -> List[Path]:
+    """Media files in in_dir, sorted by name, from a single directory read"""
+    with os.scandir(in_dir) as it:
+        names = sorted(e.name for e in it if e.name.lower().endswith(MEDIA_EXTS) and e.is_file())
+    return [in_dir / name for name in names]
+
+def output_dir(out_root: Path, vid: Path) -> Path:
+    """Output folder for a media file: its stem made filesystem-safe"""
+    return out_root / _SAFE.sub("_", vid.stem)
+
+def output_dirs(out_root: Path, files: List[Path]) -> Dict[Path, Path]:
+    """Output folder per media file; files sharing a stem (talk.mp4, talk.m4a) keep their extension"""
+    from collections import Counter
+    stems = Counter(output_dir(out_root, f) for f in files)
+    return {f: output_dir(out_root, f) if stems[output_dir(out_root, f)] == 1
+            else out_root / _SAFE.sub("_", f.name) for f in files}
+
+def ensure_dirs(out_dir: Path):
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+class CaptionWriter:
+    """
+    Streams transcript.txt, captions.srt and captions.vtt as segments arrive,
+    so long recordings are never held in memory as a segment list.
+    """
 
+    def __init__(self, out_dir: Path):
+        self.transcript, self.srt, self.vtt = (
+            (out_dir / name).open("w", encoding="utf-8", buffering=1 << 16)
+            for name in ("transcript.txt", "captions.srt", "captions.vtt")
+        )
+        self.vtt.write("WEBVTT\n\n")
+        self.count = 0
+        self._text = io.StringIO()
+
+    def add(self, start: float, end: float, text: str):
+        sa, sb = _to_ms(start), _to_ms(end)
+        a, b = _fmt(sa, ","), _fmt(sb, ",")
+        self.count += 1
+        self.transcript.write(f"[{a} - {b}] {text}\n")
+        self.srt.write(f"{self.count}\n{a} --> {b}\n{text.strip()}\n\n")
+        self.vtt.write(f"{_fmt(sa, '.')} --> {_fmt(sb, '.')}\n{text.strip()}\n\n")
+        if self.count > 1:
+            self._text.write(" ")
+        self._text.write(text)
+
+    @property
+    def full_text(self) -> str:
+        return self._text.getvalue()
+
+    def close(self):
+        for f in (self.transcript, self.srt, self.vtt):
+            f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def write_summary(out_dir: Path, full_text: str, stem: str, do_summary: bool, summary_max: int,
+                  summary_model: str = DEFAULT_SUMMARY_MODEL, summary_backend: str = "torch",
+                  cpu_threads: int = 0):
+    """Write full.txt and summary.md"""
     # full.txt
     (out_dir / "full.txt").write_text(full_text, encoding="utf-8")
 
     # summary.md
     if do_summary:
-        bullets = summarize_text(full_text, max_sentences=summary_max)
+        bullets = summarize_text(full_text, max_sentences=summary_max, model=summary_model,
+                                 backend=summary_backend, cpu_threads=cpu_threads)
         with (out_dir / "summary.md").open("w", encoding="utf-8") as f:
             f.write(f"# Summary: {stem}\n\n")
             if bullets:
@@ -233,61 +588,156 @@ def write_artifacts(out_dir: Path, segments: List[Tuple[float, float, str]], ful
             else:
                 f.write("- No content to summarize.\n")
     else:
-        if not (out_dir / "summary.md").exists():
-            (out_dir / "summary.md").write_text("# Summary\n\n", encoding="utf-8")
+        # Exclusive create: one open instead of a stat plus an open, and never clobbers
+        try:
+            with (out_dir / "summary.md").open("x", encoding="utf-8") as f:
+                f.write("# Summary\n\n")
+        except FileExistsError:
+            pass
+
+def write_artifacts(out_dir: Path, segments: List[Tuple[float, float, str]], full_text: str, stem: str, do_summary: bool, summary_max: int,
+                    summary_model: str = DEFAULT_SUMMARY_MODEL, summary_backend: str = "torch"):
+    with CaptionWriter(out_dir) as captions:
+        for (start, end, text) in segments:
+            captions.add(start, end, text)
+    write_summary(out_dir, full_text, stem, do_summary, summary_max, summary_model, summary_backend)
+    mark_done(out_dir)
 
 # --------------------------- worker ---------------------------
 
-def worker(args) -> int:
-    """Enhanced worker with better progress feedback"""
+HEARTBEAT_LIMIT = 10  # progress timeouts a silent phase may take before the stall watchdog applies
+
+class Heartbeat:
+    """
+    Prints WORKER_BEAT every `interval` seconds while a worker phase runs that
+    prints nothing (decoding, trimming, VAD, summarizing), so the controller's
+    stall watchdog only fires when the worker is really stuck. Stops early once
+    `until()` is true, and for good after `limit` seconds: the beats come from a
+    Python thread that keeps running while the main thread hangs in native code
+    (Silero VAD, CTranslate2, BLAS), so the watchdog must get its turn eventually.
+    An interval of 0 disables it.
+    """
+
+    def __init__(self, interval: float = 0, until=None, limit: float = 0):
+        self.interval = interval
+        self.until = until
+        self.limit = limit
+        self.thread = None
+
+    def __enter__(self):
+        if self.interval > 0:
+            import threading
+            self.stop = threading.Event()
+            self.thread = threading.Thread(target=self._beat, daemon=True)
+            self.thread.start()
+        return self
+
+    def _beat(self):
+        end = time.monotonic() + self.limit if self.limit > 0 else None
+        while not self.stop.wait(self.interval):
+            if self.until is not None and self.until():
+                return
+            if end is not None and time.monotonic() > end:
+                return
+            sys.stdout.write(WORKER_BEAT + "\n")
+            sys.stdout.flush()
+
+    def __exit__(self, *exc):
+        if self.thread is not None:
+            self.stop.set()
+            self.thread.join()
+        return False
+
+
+def worker(args, model=None) -> int:
+    """Enhanced worker with better progress feedback.
+
+    Pass an already loaded `model` to reuse it across files (see `serve`).
+    """
     vid = Path(args.input_file)
-    stem = re.sub(r"[^A-Za-z0-9._-]", "_", vid.stem)
-    out_dir = Path(args.output_root) / stem
+    out_dir = Path(args.out_dir)
     ensure_dirs(out_dir)
 
-    if outputs_present(out_dir):
+    if getattr(args, "overwrite", False):
+        # Redo the file: a failure midway must not leave the old sentinel behind
+        try:
+            (out_dir / DONE_MARKER).unlink()
+        except FileNotFoundError:
+            pass
+    elif outputs_present(out_dir):
         return 0  # Skip message handled by controller
 
     try:
         # Load model with feedback
-        print(f"    🤖 Loading {args.model} model...", flush=True)
-        model = load_whisper(args.model, args.compute_type)
+        if model is None:
+            print(f"    🤖 Loading {args.model} model...", flush=True)
+            args.batch_size = auto_batch_size(args.batch_size)
+            model = load_whisper(args.model, args.compute_type, args.batch_size,
+                                 cpu_threads=args.cpu_threads, num_workers=args.num_workers,
+                                 preconvert=args.preconvert)
+            print(f"    🧵 {describe_backend(args.cpu_threads)}", flush=True)
         
-        print(f"    🎵 Transcribing audio...", flush=True)
-        segments, full_text, info = transcribe_with_feedback(
-            model,
-            vid,
-            language=args.language,
-            beam_size=args.beam,
-            progress_timeout=args.progress_timeout,
-        )
+        # Transcript and captions are written while segments stream in
+        import tempfile
+        cache_path = audio_cache_path(vid, trimmed=args.trim_silence)
+        beat = getattr(args, "heartbeat", 0)
+        beat_limit = HEARTBEAT_LIMIT * args.progress_timeout
+        with tempfile.TemporaryDirectory() as tmp, CaptionWriter(out_dir) as captions, \
+                Heartbeat(beat, until=lambda: captions.count > 0, limit=beat_limit):
+            source = vid
+            if args.trim_silence and not cache_path.exists():
+                print(f"    ✂️  Removing silence...", flush=True)
+                source = preprocess_audio(vid, Path(tmp) / "audio.wav")
+            audio = decode_to_f32(source, cache_path)
+
+            print(f"    🎵 Transcribing audio...", flush=True)
+            _, full_text, info = transcribe_with_feedback(
+                model,
+                audio,
+                language=args.language,
+                beam_size=args.beam,
+                progress_timeout=args.progress_timeout,
+                batch_size=args.batch_size,
+                vad_filter=not args.trim_silence,
+                writer=captions,
+            )
         
+        del audio
+        drop_audio_cache(vid, trimmed=args.trim_silence)
+
         # Show transcription results
         duration = info.duration if hasattr(info, 'duration') else 0
         detected_lang = info.language if hasattr(info, 'language') else 'unknown'
-        print(f"    📊 Audio: {duration:.1f}s | Language: {detected_lang} | Segments: {len(segments)}", flush=True)
+        print(f"    📊 Audio: {duration:.1f}s | Language: {detected_lang} | Segments: {captions.count}", flush=True)
         
         # Generate summary if enabled
         if args.summarizer == "bart":
             print(f"    🧠 Generating AI summary...", flush=True)
         
-        # Write all output files
+        # Write remaining output files
         print(f"    💾 Writing output files...", flush=True)
-        write_artifacts(
-            out_dir=out_dir,
-            segments=segments,
-            full_text=full_text,
-            stem=stem,
-            do_summary=(args.summarizer == "bart"),
-            summary_max=args.summary_max,
-        )
+        with Heartbeat(beat, limit=beat_limit):
+            write_summary(
+                out_dir=out_dir,
+                full_text=full_text,
+                stem=out_dir.name,
+                do_summary=(args.summarizer == "bart"),
+                summary_max=args.summary_max,
+                summary_model=args.summary_model,
+                summary_backend=args.summary_backend,
+                cpu_threads=args.cpu_threads,
+            )
+        mark_done(out_dir)
         
         # Success feedback
         word_count = len(full_text.split())
-        print(f"    ✨ Generated {word_count} words in {len(segments)} segments", flush=True)
+        print(f"    ✨ Generated {word_count} words in {captions.count} segments", flush=True)
         
         return 0
         
+    except subprocess.CalledProcessError as e:
+        print(f"    ❌ ffmpeg failed (exit code {e.returncode})", flush=True)
+        return 99
     except RuntimeError as e:
         if "progress-timeout" in str(e):
             print(f"    ⏰ Timeout: No progress for {args.progress_timeout}s", flush=True)
@@ -299,8 +749,184 @@ def worker(args) -> int:
         print(f"    ❌ Unexpected error: {e}", flush=True)
         return 99
 
+WORKER_READY = "@@ready"
+WORKER_DONE = "@@done"
+WORKER_BEAT = "@@beat"
+WORKER_LOAD_TIMEOUT = 1800  # seconds for a worker to load its models when --timeout is 0
+
+# Settings the controller hands to the worker; each job then names its input and output folder
+WORKER_OPTIONS = (
+    "model", "compute_type", "language", "beam", "batch_size", "cpu_threads", "num_workers",
+    "preconvert", "trim_silence", "summarizer", "summary_max", "summary_model", "summary_backend",
+    "progress_timeout",
+)
+
+def worker_settings(args) -> Dict:
+    """Worker settings sent to `serve` as its first stdin line"""
+    return {name: getattr(args, name) for name in WORKER_OPTIONS}
+
+def serve() -> int:
+    """
+    Long-lived worker used by the controller.
+    Reads its settings as one JSON line (no argparse round-trip), loads the
+    Whisper model and summarizer once, then reads one JSON job per stdin line
+    ({"input_file": ..., "out_dir": ...}) and answers each with a `@@done <exit code>` line.
+    """
+    args = argparse.Namespace(**json.loads(sys.stdin.readline()))
+    if getattr(args, "cpu_set", None) and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, args.cpu_set)
+    try:
+        print(f"    🤖 Loading {args.model} model...", flush=True)
+        args.batch_size = auto_batch_size(args.batch_size)
+        model = load_whisper(args.model, args.compute_type, args.batch_size,
+                             cpu_threads=args.cpu_threads, num_workers=args.num_workers,
+                             preconvert=args.preconvert)
+        print(f"    🧵 {describe_backend(args.cpu_threads)}", flush=True)
+        # Load the summarizer up front too: a first-time download prints no
+        # complete lines and would otherwise trip the per-file stall watchdog
+        if args.summarizer == "bart":
+            print(f"    🧠 Loading summary model...", flush=True)
+            _load_summarizer(args.summary_model, args.summary_backend, args.cpu_threads)
+    except Exception as e:
+        print(f"    ❌ Could not load model: {e}", flush=True)
+        return 99
+    # Keep the controller's stall watchdog fed during phases that print nothing
+    args.heartbeat = args.progress_timeout / 3 if args.progress_timeout > 0 else 0
+    print(WORKER_READY, flush=True)
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        job = json.loads(line)
+        args.input_file, args.out_dir = job["input_file"], job["out_dir"]
+        code = worker(args, model=model)
+        print(f"{WORKER_DONE} {code}", flush=True)
+    return 0
+
 # --------------------------- controller ---------------------------
 
+class WorkerProcess:
+    """
+    Supervisor for the persistent `serve` subprocess.
+    Forwards the worker's output, kills it when a file exceeds its timeout or
+    stops printing progress, and respawns it lazily for the next file.
+    The stall check runs here rather than in the worker so it still fires
+    when the worker is stuck inside native code (BLAS) between segments.
+    Silent phases (decode, trim, VAD, summary) send WORKER_BEAT lines instead,
+    for up to HEARTBEAT_LIMIT stall timeouts each (see Heartbeat).
+    """
+
+    def __init__(self, cmd: List[str], settings: Optional[Dict] = None, progress_timeout: int = 0,
+                 env: Optional[Dict[str, str]] = None):
+        self.cmd = cmd
+        self.settings = settings or {}
+        self.progress_timeout = progress_timeout
+        self.env = env
+        self.proc = None
+        self.lines = None
+
+    def _start(self):
+        self.proc = subprocess.Popen(
+            self.cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,  # warnings and tracebacks count as activity too
+            text=True,
+            bufsize=1,
+            env=self.env,
+        )
+        self.proc.stdin.write(json.dumps(self.settings) + "\n")
+        self.proc.stdin.flush()
+        import queue
+        import threading
+        self.lines = queue.Queue()
+        threading.Thread(target=self._pump, args=(self.proc.stdout, self.lines), daemon=True).start()
+
+    @staticmethod
+    def _pump(stream, lines):
+        for line in stream:
+            lines.put(line.rstrip("\n"))
+        lines.put(None)  # EOF: the worker exited
+
+    def _next_line(self, deadline: Optional[float] = None, timeout: int = 0):
+        """Wait for the next output line; kills the worker and raises TimeoutExpired on timeout or stall"""
+        wait = limit = self.progress_timeout if self.progress_timeout > 0 else None
+        if deadline is not None and (wait is None or deadline - time.monotonic() < wait):
+            wait, limit = max(0.0, deadline - time.monotonic()), timeout
+        import queue
+        try:
+            return self.lines.get(timeout=wait)
+        except queue.Empty:
+            self.kill()
+            raise subprocess.TimeoutExpired(self.cmd, limit)
+
+    def run(self, vid: Path, out_dir: Path, timeout: int = 0, prefix: str = "") -> int:
+        """Transcribe one file in the worker and return its exit code; output lines get `prefix`"""
+        if self.proc is None or self.proc.poll() is not None:
+            self._start()
+            # Model loading prints nothing while downloading, so the stall watchdog
+            # stays off; --timeout (or WORKER_LOAD_TIMEOUT) still bounds it
+            import queue
+            limit = timeout or WORKER_LOAD_TIMEOUT
+            load_deadline = time.monotonic() + limit
+            while True:
+                try:
+                    line = self.lines.get(timeout=max(0.0, load_deadline - time.monotonic()))
+                except queue.Empty:
+                    self.kill()
+                    raise subprocess.TimeoutExpired(self.cmd, limit)
+                if line is None:
+                    return self._exit_code()
+                if line == WORKER_READY:
+                    break
+                print(prefix + line, flush=True)
+
+        self.proc.stdin.write(json.dumps({"input_file": str(vid), "out_dir": str(out_dir)}) + "\n")
+        self.proc.stdin.flush()
+
+        deadline = time.monotonic() + timeout if timeout > 0 else None
+        while True:
+            line = self._next_line(deadline, timeout)
+            if line is None:
+                return self._exit_code()
+            if line.startswith(WORKER_DONE):
+                return int(line.split()[1])
+            if WORKER_BEAT in line:
+                # Counts as activity; may share a line with an unflushed print
+                line = line.replace(WORKER_BEAT, "")
+                if not line.strip():
+                    continue
+            print(prefix + line, flush=True)
+
+    def _exit_code(self) -> int:
+        code = self.proc.wait()
+        self.proc = None
+        return code or 99
+
+    def abort(self):
+        """Kill the worker from another thread; its current run() returns the signal's exit code"""
+        proc = self.proc
+        if proc is not None:
+            proc.kill()
+
+    def kill(self):
+        if self.proc is not None:
+            self.proc.kill()
+            self.proc.wait()
+            self.proc = None
+
+    def close(self):
+        """Let the worker finish cleanly by closing its stdin"""
+        if self.proc is not None:
+            self.proc.stdin.close()
+            try:
+                self.proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.kill()
+            self.proc = None
+
+
 def print_summary_stats(total: int, done: int, skipped: int, failed: int):
     """Print a nicely formatted summary of processing results"""
     success_rate = (done / total * 100) if total > 0 else 0
@@ -319,6 +945,90 @@ def print_summary_stats(total: int, done: int, skipped: int, failed: int):
     elif failed > 0:
         print(f"\n{Colors.YELLOW}⚠️  Some files failed - check error messages above{Colors.END}")
 
+def split_cores(n: int) -> List[List[int]]:
+    """
+    Split the usable cores into n contiguous sets, one per parallel worker.
+    Contiguous ranges keep each worker on as few NUMA nodes as possible.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cores = sorted(os.sched_getaffinity(0))
+    else:
+        cores = list(range(os.cpu_count() or 1))
+    k = len(cores) // n
+    if k == 0:  # more workers than cores: share them round-robin
+        return [[cores[i % len(cores)]] for i in range(n)]
+    return [cores[i * k:(i + 1) * k] for i in range(n)]
+
+def split_gpus(n: int) -> List[str]:
+    """
+    Assign each of n parallel workers a CUDA device (round-robin), as
+    CUDA_VISIBLE_DEVICES values; empty when no GPU is available.
+    """
+    count = cuda_device_count()
+    if count == 0:
+        return []
+    visible = os.environ.get("CUDA_VISIBLE_DEVICES")
+    ids = [d.strip() for d in visible.split(",") if d.strip()][:count] if visible else []
+    ids = ids or [str(i) for i in range(count)]
+    return [ids[i % len(ids)] for i in range(n)]
+
+def process_file(args, proc: "WorkerProcess", vid: Path, out_dir: Path, progress: str,
+                 completed: set, parallel: bool = False, stop=None) -> str:
+    """
+    Transcribe one file into out_dir with retries; returns done, skipped or failed.
+    completed holds finished folder names (see completed_outputs). Raises
+    KeyboardInterrupt instead of retrying once `stop` (a threading.Event) is
+    set or the worker was killed by a signal.
+    """
+    # Parallel output interleaves, so tag every line with its file
+    indent = f"{Colors.CYAN}{progress}{Colors.END}  " if parallel else "         "
+    
+    # Progress header
+    file_size = vid.stat().st_size / (1024 * 1024)  # MB
+    
+    print(f"\n{Colors.CYAN}{progress}{Colors.END} {Colors.BOLD}{vid.name}{Colors.END} ({file_size:.1f} MB)")
+
+    if out_dir.name in completed:
+        if not (out_dir / DONE_MARKER).exists():
+            mark_done(out_dir)  # adopt outputs from before the sentinel existed
+        print(f"{indent}{Colors.YELLOW}⏭️  SKIP - Already processed{Colors.END}")
+        return "skipped"
+
+    tries = args.retries + 1
+    attempt = 1
+    file_start_time = time.time()
+    
+    while attempt <= tries:
+        if stop is not None and stop.is_set():
+            raise KeyboardInterrupt
+        if attempt > 1:
+            print(f"{indent}{Colors.YELLOW}🔄 Retry {attempt}/{tries}{Colors.END}")
+        
+        try:
+            code = proc.run(vid, out_dir, timeout=args.timeout, prefix=progress if parallel else "")
+            if code < 0 or (stop is not None and stop.is_set()):
+                # Ctrl+C reaches the workers too: abort the run rather than retry
+                raise KeyboardInterrupt
+            if code != 0:
+                raise subprocess.CalledProcessError(code, proc.cmd)
+            file_duration = time.time() - file_start_time
+            print(f"{indent}{Colors.GREEN}✅ DONE in {file_duration:.1f}s{Colors.END}")
+            return "done"
+            
+        except subprocess.TimeoutExpired as e:
+            print(f"{indent}{Colors.RED}⏰ TIMEOUT after {int(e.timeout)}s{Colors.END}")
+        except subprocess.CalledProcessError as e:
+            print(f"{indent}{Colors.RED}❌ ERROR (exit code {e.returncode}){Colors.END}")
+            
+        attempt += 1
+        if attempt <= tries:
+            time.sleep(3)
+
+    print(f"{indent}{Colors.RED}💥 FAILED after {tries} attempts{Colors.END}")
+    # The decoded audio is only kept for retries
+    drop_audio_cache(vid, trimmed=args.trim_silence)
+    return "failed"
+
 def controller(args):
     """Enhanced controller with better visual feedback and error handling"""
     
@@ -336,12 +1046,12 @@ def controller(args):
     out_root.mkdir(parents=True, exist_ok=True)
     
     # Find video files
-    print(f"\n{Colors.BLUE}🔍 Scanning for MP4 files in: {Colors.BOLD}{in_dir.resolve()}{Colors.END}")
-    all_files = sorted(in_dir.glob("*.mp4"))
+    print(f"\n{Colors.BLUE}🔍 Scanning for media files in: {Colors.BOLD}{in_dir.resolve()}{Colors.END}")
+    all_files = find_media_files(in_dir)
     
     if not all_files:
-        print(f"{Colors.YELLOW}⚠️  No .mp4 files found in {in_dir.resolve()}{Colors.END}")
-        print(f"{Colors.CYAN}💡 Make sure your video files are in .mp4 format and in the correct directory{Colors.END}")
+        print(f"{Colors.YELLOW}⚠️  No media files found in {in_dir.resolve()}{Colors.END}")
+        print(f"{Colors.CYAN}💡 Supported formats: {', '.join(MEDIA_EXTS)}{Colors.END}")
         return
 
     # File selection
@@ -354,78 +1064,85 @@ def controller(args):
         files = all_files
 
     total = len(files)
-    done = 0
-    skipped = 0 
-    failed = 0
+    workers = max(1, min(args.parallel, total))
     
     # Print processing info
-    print(f"{Colors.GREEN}✅ Found {total} MP4 files{Colors.END}")
+    print(f"{Colors.GREEN}✅ Found {total} media files{Colors.END}")
     print(f"{Colors.BLUE}📁 Output directory: {Colors.BOLD}{out_root.resolve()}{Colors.END}")
     print(f"{Colors.BLUE}🤖 Model: {Colors.BOLD}{args.model}{Colors.END} | Language: {Colors.BOLD}{args.language}{Colors.END}")
+    if workers > 1:
+        print(f"{Colors.BLUE}⚡ Parallel workers: {Colors.BOLD}{workers}{Colors.END}")
     print("\n" + "═" * 70)
     print(f"{Colors.BOLD}🚀 Starting batch processing...{Colors.END}")
     print("═" * 70)
 
     start_time = time.time()
-    
-    for idx, vid in enumerate(files, 1):
-        stem = re.sub(r"[^A-Za-z0-9._-]", "_", vid.stem)
-        out_dir = out_root / stem
-        
-        # Progress header
-        progress = f"[{idx:2d}/{total}]"
-        file_size = vid.stat().st_size / (1024 * 1024)  # MB
-        
-        print(f"\n{Colors.CYAN}{progress}{Colors.END} {Colors.BOLD}{vid.name}{Colors.END} ({file_size:.1f} MB)")
+    completed = completed_outputs(out_root)
+    # Named from the whole folder so a selection maps files to the same outputs
+    out_dirs = output_dirs(out_root, all_files)
+
+    # Long-lived workers load the model once and are reused for every file;
+    # in parallel mode each one gets its own disjoint set of cores and,
+    # with several GPUs, its own device
+    import queue
+    pool = queue.Queue()
+    procs = []
+    gpus = split_gpus(workers) if workers > 1 else []
+    for i, cpu_set in enumerate(split_cores(workers) if workers > 1 else [None]):
+        threads = args.cpu_threads or (len(cpu_set) if cpu_set else 0)
+        settings = worker_settings(args)
+        settings.update(cpu_threads=threads, cpu_set=cpu_set)
+        env = worker_env(threads)
+        if gpus:
+            env["CUDA_VISIBLE_DEVICES"] = gpus[i]
+        proc = WorkerProcess(
+            [sys.executable, __file__, "serve"],
+            settings=settings,
+            progress_timeout=args.progress_timeout,
+            env=env,
+        )
+        procs.append(proc)
+        pool.put(proc)
 
-        if outputs_present(out_dir):
-            print(f"         {Colors.YELLOW}⏭️  SKIP - Already processed{Colors.END}")
-            skipped += 1
-            continue
+    import threading
+    stop = threading.Event()
 
-        cmd = [
-            sys.executable, __file__, "single",
-            "--input-file", str(vid),
-            "--output-root", str(out_root),
-            "--model", args.model,
-            "--compute-type", args.compute_type,
-            "--language", args.language,
-            "--beam", str(args.beam),
-            "--summarizer", args.summarizer,
-            "--summary-max", str(args.summary_max),
-            "--progress-timeout", str(args.progress_timeout),
-        ]
-
-        tries = args.retries + 1
-        attempt = 1
-        file_start_time = time.time()
-        
-        while attempt <= tries:
-            if attempt > 1:
-                print(f"         {Colors.YELLOW}🔄 Retry {attempt}/{tries}{Colors.END}")
-            
-            try:
-                subprocess.run(
-                    cmd,
-                    check=True,
-                    timeout=args.timeout if args.timeout > 0 else None,
-                )
-                file_duration = time.time() - file_start_time
-                print(f"         {Colors.GREEN}✅ DONE in {file_duration:.1f}s{Colors.END}")
-                done += 1
-                break
-                
-            except subprocess.TimeoutExpired:
-                print(f"         {Colors.RED}⏰ TIMEOUT after {args.timeout}s{Colors.END}")
-            except subprocess.CalledProcessError as e:
-                print(f"         {Colors.RED}❌ ERROR (exit code {e.returncode}){Colors.END}")
-                
-            attempt += 1
-            if attempt <= tries:
-                time.sleep(3)
-            else:
-                print(f"         {Colors.RED}💥 FAILED after {tries} attempts{Colors.END}")
-                failed += 1
+    def run_file(idx: int, vid: Path) -> str:
+        proc = pool.get()
+        try:
+            return process_file(args, proc, vid, out_dirs[vid], f"[{idx:2d}/{total}]", completed,
+                                parallel=workers > 1, stop=stop)
+        except KeyboardInterrupt:
+            stop.set()  # a worker killed by Ctrl+C: don't start the next file
+            raise
+        finally:
+            pool.put(proc)
+
+    try:
+        if workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                futures = [ex.submit(run_file, idx, vid) for idx, vid in enumerate(files, 1)]
+                try:
+                    results = [f.result() for f in futures]
+                except KeyboardInterrupt:
+                    # Queued files never start (no cancel_futures before 3.9) and
+                    # running ones end without a retry
+                    stop.set()
+                    for f in futures:
+                        f.cancel()
+                    for proc in procs:
+                        proc.abort()
+                    raise
+        else:
+            results = [run_file(idx, vid) for idx, vid in enumerate(files, 1)]
+    finally:
+        for proc in procs:
+            proc.close()
+
+    done = results.count("done")
+    skipped = results.count("skipped")
+    failed = results.count("failed")
 
     # Final summary
     total_duration = time.time() - start_time
@@ -452,8 +1169,8 @@ def process_single_file(args):
         print(f"{Colors.RED}❌ File not found: {input_file}{Colors.END}")
         return
     
-    if not input_file.suffix.lower() == '.mp4':
-        print(f"{Colors.YELLOW}⚠️  Warning: File is not .mp4 format. Proceeding anyway...{Colors.END}")
+    if input_file.suffix.lower() not in MEDIA_EXTS:
+        print(f"{Colors.YELLOW}⚠️  Warning: Unrecognized file format. Proceeding anyway...{Colors.END}")
     
     # Determine output directory
     if hasattr(args, 'output') and args.output:
@@ -476,13 +1193,14 @@ def process_single_file(args):
     print(f"🧠 Summary:     {Colors.BOLD}{'Yes' if args.summarizer == 'bart' else 'No'}{Colors.END}")
     
     # Create worker args
-    stem = re.sub(r"[^A-Za-z0-9._-]", "_", input_file.stem)
-    out_dir = output_root / stem
+    siblings = [f for f in find_media_files(input_file.parent) if f.name != input_file.name]
+    out_dir = output_dirs(output_root, [input_file] + siblings)[input_file]
     
-    if outputs_present(out_dir):
+    overwrite = outputs_present(out_dir)
+    if overwrite:
         print(f"\n{Colors.YELLOW}⏭️  File already processed. Outputs exist in: {out_dir}{Colors.END}")
-        overwrite = input(f"Overwrite existing outputs? [y/N]: ").strip().lower()
-        if overwrite != 'y':
+        answer = input(f"Overwrite existing outputs? [y/N]: ").strip().lower()
+        if answer != 'y':
             print(f"{Colors.BLUE}✋ Skipping file{Colors.END}")
             return
     
@@ -490,13 +1208,21 @@ def process_single_file(args):
     class SingleFileArgs:
         def __init__(self):
             self.input_file = str(input_file)
-            self.output_root = str(output_root)
+            self.out_dir = str(out_dir)
+            self.overwrite = overwrite
             self.model = args.model
             self.compute_type = args.compute_type
             self.language = args.language
             self.beam = args.beam
+            self.batch_size = args.batch_size
+            self.cpu_threads = args.cpu_threads
+            self.num_workers = args.num_workers
+            self.trim_silence = args.trim_silence
+            self.preconvert = args.preconvert
             self.summarizer = args.summarizer if not (hasattr(args, 'no_summary') and args.no_summary) else "none"
             self.summary_max = args.summary_max
+            self.summary_model = args.summary_model
+            self.summary_backend = args.summary_backend
             self.progress_timeout = 180  # Default
     
     worker_args = SingleFileArgs()
@@ -529,9 +1255,13 @@ def process_single_file(args):
         print(f"\n{Colors.YELLOW}⚠️  Processing interrupted by user{Colors.END}")
     except Exception as e:
         print(f"\n{Colors.RED}💥 Unexpected error: {e}{Colors.END}")
+    finally:
+        # No retries here, so a failed run's decoded audio is never reused
+        drop_audio_cache(input_file, trimmed=args.trim_silence)
 
 # --------------------------- config management ---------------------------
 
+@lru_cache(maxsize=1)
 def get_config_path() -> Path:
     """Get the path to the user configuration file"""
     # Use XDG Base Directory specification on Unix-like systems
@@ -543,8 +1273,8 @@ def get_config_path() -> Path:
     config_path = Path(config_dir) / 'video-transcribe' / 'config.json'
     return config_path
 
-def load_config() -> Dict:
-    """Load configuration from file"""
+@lru_cache(maxsize=1)
+def _read_config() -> Dict:
     config_path = get_config_path()
     if config_path.exists():
         try:
@@ -554,6 +1284,10 @@ def load_config() -> Dict:
             pass
     return {}
 
+def load_config() -> Dict:
+    """Load configuration from file (read once per process; callers get a copy)"""
+    return dict(_read_config())
+
 def save_config(config: Dict) -> None:
     """Save configuration to file"""
     config_path = get_config_path()
@@ -562,6 +1296,7 @@ def save_config(config: Dict) -> None:
     try:
         with open(config_path, 'w') as f:
             json.dump(config, f, indent=2)
+        _read_config.cache_clear()
         print(f"{Colors.GREEN}💾 Configuration saved to {config_path}{Colors.END}")
     except IOError as e:
         print(f"{Colors.YELLOW}⚠️  Could not save config: {e}{Colors.END}")
@@ -589,28 +1324,32 @@ def browse_for_file() -> Optional[str]:
     print(f"\n{Colors.BOLD}📁 File Browser{Colors.END}")
     
     current_dir = Path.cwd()
+    items = None  # listing of current_dir, only re-read when the directory changes
     
     while True:
         print(f"\n📍 Current directory: {Colors.BOLD}{current_dir}{Colors.END}")
         
-        # List video files and directories
-        items = []
-        
-        # Add parent directory option if not at root
-        if current_dir.parent != current_dir:
-            items.append(("📁 ..", current_dir.parent, "directory"))
-        
-        # Add subdirectories
-        try:
-            for item in sorted(current_dir.iterdir()):
-                if item.is_dir() and not item.name.startswith('.'):
-                    items.append((f"📁 {item.name}/", item, "directory"))
-                elif item.suffix.lower() in ['.mp4', '.mov', '.avi', '.mkv', '.webm']:
-                    size_mb = item.stat().st_size / (1024 * 1024)
-                    items.append((f"🎥 {item.name} ({size_mb:.1f} MB)", item, "video"))
-        except PermissionError:
-            print(f"{Colors.RED}❌ Permission denied accessing this directory{Colors.END}")
-            return None
+        if items is None:
+            # List video files and directories
+            items = []
+            
+            # Add parent directory option if not at root
+            if current_dir.parent != current_dir:
+                items.append(("📁 ..", current_dir.parent, "directory"))
+            
+            # Add subdirectories; one scandir pass also yields the sizes
+            try:
+                with os.scandir(current_dir) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+                for entry in entries:
+                    if entry.is_dir() and not entry.name.startswith('.'):
+                        items.append((f"📁 {entry.name}/", current_dir / entry.name, "directory"))
+                    elif os.path.splitext(entry.name)[1].lower() in MEDIA_EXTS:
+                        size_mb = entry.stat().st_size / (1024 * 1024)
+                        items.append((f"🎥 {entry.name} ({size_mb:.1f} MB)", current_dir / entry.name, "video"))
+            except PermissionError:
+                print(f"{Colors.RED}❌ Permission denied accessing this directory{Colors.END}")
+                return None
         
         if not items:
             print(f"{Colors.YELLOW}No directories or video files found{Colors.END}")
@@ -634,6 +1373,7 @@ def browse_for_file() -> Optional[str]:
                 new_dir = Path(path_input).resolve()
                 if new_dir.exists() and new_dir.is_dir():
                     current_dir = new_dir
+                    items = None
                 else:
                     print(f"{Colors.RED}❌ Invalid directory path{Colors.END}")
             except Exception:
@@ -645,6 +1385,7 @@ def browse_for_file() -> Optional[str]:
                     display, path, item_type = items[idx]
                     if item_type == "directory":
                         current_dir = path
+                        items = None
                     else:  # video file
                         return str(path)
                 else:
@@ -656,20 +1397,20 @@ def select_files_interactive(input_dir: Path) -> List[Path]:
     """Interactive file selection from input directory"""
     print(f"\n{Colors.BOLD}📋 File Selection{Colors.END}")
     
-    files = sorted(input_dir.glob("*.mp4"))
+    files = find_media_files(input_dir)
     if not files:
-        print(f"{Colors.YELLOW}No MP4 files found in {input_dir}{Colors.END}")
+        print(f"{Colors.YELLOW}No media files found in {input_dir}{Colors.END}")
         return []
     
-    print(f"\nFound {len(files)} MP4 files:")
+    print(f"\nFound {len(files)} media files:")
     selected = [False] * len(files)
+    sizes_mb = [f.stat().st_size / (1024 * 1024) for f in files]  # stat once, not per redraw
     
     while True:
         print(f"\n📁 Files in {Colors.BOLD}{input_dir.name}{Colors.END}:")
         for i, file in enumerate(files):
             status = "✅" if selected[i] else "⬜"
-            size_mb = file.stat().st_size / (1024 * 1024)
-            print(f"  {i+1:2d}. {status} {file.name} ({size_mb:.1f} MB)")
+            print(f"  {i+1:2d}. {status} {file.name} ({sizes_mb[i]:.1f} MB)")
         
         selected_count = sum(selected)
         print(f"\n📊 Selected: {selected_count}/{len(files)} files")
@@ -713,6 +1454,23 @@ def select_files_interactive(input_dir: Path) -> List[Path]:
 
 # --------------------------- interactive setup ---------------------------
 
+# Menu choices of the setup wizard
+_MODEL_CHOICES = {
+    "1": ("tiny", "Fastest, least accurate (~39 MB)"),
+    "2": ("base", "Fast, good for real-time (~74 MB)"),
+    "3": ("small", "Balanced speed/accuracy (~244 MB)"),
+    "4": ("medium", "Good accuracy (~769 MB)"),
+    "5": ("large-v3", "Best accuracy, slower (~1550 MB)")
+}
+_MODEL_TO_CHOICE = {name: key for key, (name, _) in _MODEL_CHOICES.items()}
+_LANG_CHOICES = {"1": "auto", "2": "en", "3": "es", "4": "fr"}
+_LANG_TO_CHOICE = {code: key for key, code in _LANG_CHOICES.items()}
+_COMPUTE_CHOICES = {"1": "auto", "2": "int8", "3": "int16", "4": "float16"}
+
+def _ask(question: str, default: str) -> str:
+    """Prompt showing the default in brackets; an empty answer takes the default"""
+    return input(f"{question} [{default}]: ").strip() or default
+
 def interactive_setup() -> Dict:
     """Interactive wizard to set up transcription parameters"""
     print_banner()
@@ -727,31 +1485,20 @@ def interactive_setup() -> Dict:
     
     # Input directory
     while True:
-        default_input = saved_config.get("input", "./input_mp4")
-        prompt = f"📁 Input directory [{default_input}]: "
-        config["input"] = input(prompt).strip() or default_input
+        config["input"] = _ask("📁 Input directory", saved_config.get("input", "./input_mp4"))
         if Path(config["input"]).exists():
             break
         print(f"{Colors.RED}❌ Directory not found. Please enter a valid path.{Colors.END}")
     
     # Output directory  
-    default_output = saved_config.get("output", "./outputs")
-    prompt = f"📂 Output directory [{default_output}]: "
-    config["output"] = input(prompt).strip() or default_output
+    config["output"] = _ask("📂 Output directory", saved_config.get("output", "./outputs"))
     
     # Model selection
-    models = {
-        "1": ("tiny", "Fastest, least accurate (~39 MB)"),
-        "2": ("base", "Fast, good for real-time (~74 MB)"),
-        "3": ("small", "Balanced speed/accuracy (~244 MB)"),
-        "4": ("medium", "Good accuracy (~769 MB)"),
-        "5": ("large-v3", "Best accuracy, slower (~1550 MB)")
-    }
+    models = _MODEL_CHOICES
     
     # Find default model choice
     saved_model = saved_config.get("model", "large-v3")
-    model_to_num = {v[0]: k for k, v in models.items()}
-    default_choice = model_to_num.get(saved_model, "5")
+    default_choice = _MODEL_TO_CHOICE.get(saved_model, "5")
     
     print(f"\n🤖 {Colors.BOLD}Select Whisper Model:{Colors.END}")
     for key, (name, desc) in models.items():
@@ -759,7 +1506,7 @@ def interactive_setup() -> Dict:
         print(f"  {key}. {Colors.BOLD}{name}{Colors.END} - {desc}{marker}")
     
     while True:
-        choice = input(f"\nEnter choice [{default_choice}]: ").strip() or default_choice
+        choice = _ask("\nEnter choice", default_choice)
         if choice in models:
             config["model"] = models[choice][0]
             break
@@ -775,17 +1522,15 @@ def interactive_setup() -> Dict:
     print("  5. Other (specify code)")
     
     # Determine default based on saved config
-    lang_map = {"auto": "1", "en": "2", "es": "3", "fr": "4"}
-    default_lang_choice = lang_map.get(saved_language, "5" if saved_language != "auto" else "1")
+    default_lang_choice = _LANG_TO_CHOICE.get(saved_language, "5" if saved_language != "auto" else "1")
     
-    lang_choice = input(f"\nEnter choice [{default_lang_choice}]: ").strip() or default_lang_choice
-    reverse_lang_map = {"1": "auto", "2": "en", "3": "es", "4": "fr"}
+    lang_choice = _ask("\nEnter choice", default_lang_choice)
     
-    if lang_choice in reverse_lang_map:
-        config["language"] = reverse_lang_map[lang_choice]
+    if lang_choice in _LANG_CHOICES:
+        config["language"] = _LANG_CHOICES[lang_choice]
     elif lang_choice == "5":
-        default_other = saved_language if saved_language not in reverse_lang_map.values() else ""
-        config["language"] = input(f"Enter language code [{default_other}]: ").strip() or default_other
+        default_other = saved_language if saved_language not in _LANG_TO_CHOICE else ""
+        config["language"] = _ask("Enter language code", default_other)
     else:
         config["language"] = "auto"
     
@@ -800,24 +1545,24 @@ def interactive_setup() -> Dict:
     if advanced_choice == "y":
         # Compute type
         print(f"\n💻 {Colors.BOLD}Compute Type:{Colors.END}")
-        print("  1. int8 - Balanced (recommended)")
-        print("  2. int16 - Better quality, more memory") 
-        print("  3. float16 - Best quality (GPU recommended)")
+        print("  1. auto - float16 on GPU, int8 on CPU (recommended)")
+        print("  2. int8 - Balanced")
+        print("  3. int16 - Better quality, more memory") 
+        print("  4. float16 - Best quality (GPU recommended)")
         
-        compute_choice = input(f"\nEnter choice [1]: ").strip() or "1"
-        compute_map = {"1": "int8", "2": "int16", "3": "float16"}
-        config["compute_type"] = compute_map.get(compute_choice, "int8")
+        compute_choice = _ask("\nEnter choice", "1")
+        config["compute_type"] = _COMPUTE_CHOICES.get(compute_choice, "auto")
         
         # Beam size
-        default_beam = saved_config.get("beam", 5)
-        beam_input = input(f"\n🎯 Beam size (1-10, higher=more accurate) [{default_beam}]: ").strip()
+        default_beam = saved_config.get("beam", 1)
+        beam_input = _ask("\n🎯 Beam size (1-10, higher=more accurate)", str(default_beam))
         try:
-            config["beam"] = max(1, min(10, int(beam_input))) if beam_input else default_beam
+            config["beam"] = max(1, min(10, int(beam_input)))
         except ValueError:
             config["beam"] = default_beam
     else:
-        config["compute_type"] = saved_config.get("compute_type", "int8")
-        config["beam"] = saved_config.get("beam", 5)
+        config["compute_type"] = saved_config.get("compute_type", "auto")
+        config["beam"] = saved_config.get("beam", 1)
     
     # Ask to save config
     save_choice = input(f"\n💾 Save these settings as defaults? [Y/n]: ").strip().lower()
@@ -887,23 +1632,33 @@ def check_system_requirements():
         print(f"System: {Colors.YELLOW}ℹ️  Install 'psutil' for detailed system info{Colors.END}")
         return python_ok
 
-def validate_dependencies():
-    """Enhanced dependency check with detailed feedback"""
+def validate_dependencies(system: bool = False):
+    """
+    Enhanced dependency check with detailed feedback.
+    The hardware report (psutil probes) only runs when system=True (--check-deps).
+    """
     print(f"{Colors.BLUE}🔍 Checking dependencies...{Colors.END}")
     all_good = True
     
     # System requirements
-    if not check_system_requirements():
+    if system and not check_system_requirements():
         all_good = False
     
     print(f"\n{Colors.BOLD}📦 Required Software{Colors.END}")
     print("─" * 50)
     
-    # Check FFmpeg
+    # Check FFmpeg: a PATH lookup; the version probe (a process spawn) only for --check-deps
+    import shutil
     try:
-        result = subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True, text=True)
-        version_line = result.stdout.split('\n')[0]
-        print(f"{Colors.GREEN}✅ FFmpeg: {version_line.split()[2]}{Colors.END}")
+        ffmpeg_path = shutil.which("ffmpeg")
+        if ffmpeg_path is None:
+            raise FileNotFoundError("ffmpeg")
+        if system:
+            result = subprocess.run([ffmpeg_path, "-version"], capture_output=True, check=True, text=True)
+            version_line = result.stdout.split('\n')[0]
+            print(f"{Colors.GREEN}✅ FFmpeg: {version_line.split()[2]}{Colors.END}")
+        else:
+            print(f"{Colors.GREEN}✅ FFmpeg: {ffmpeg_path}{Colors.END}")
     except (subprocess.CalledProcessError, FileNotFoundError):
         print(f"{Colors.RED}❌ FFmpeg not found{Colors.END}")
         print(f"{Colors.YELLOW}💡 Installation instructions:{Colors.END}")
@@ -925,15 +1680,21 @@ def validate_dependencies():
     
     missing = []
     
+    # Locate packages and read their versions from metadata; importing torch
+    # and transformers just to print a version costs seconds
+    from importlib.metadata import version, PackageNotFoundError
+    from importlib.util import find_spec
     for import_name, install_name, description in package_info:
-        try:
-            module = __import__(import_name.replace("-", "_"))
-            version = getattr(module, '__version__', 'unknown')
-            print(f"{Colors.GREEN}✅ {install_name}: {version}{Colors.END}")
-        except ImportError:
+        if find_spec(import_name) is None:
             missing.append(install_name)
             print(f"{Colors.RED}❌ {install_name}: {description}{Colors.END}")
             all_good = False
+            continue
+        try:
+            pkg_version = version(install_name)
+        except PackageNotFoundError:
+            pkg_version = "unknown"
+        print(f"{Colors.GREEN}✅ {install_name}: {pkg_version}{Colors.END}")
     
     if missing:
         print(f"\n{Colors.YELLOW}💡 Install missing packages:{Colors.END}")
@@ -943,43 +1704,42 @@ def validate_dependencies():
     
     return all_good
 
+WHISPER_MODELS = [
+    ("tiny", "~39 MB", "Speed: Very Fast", "Accuracy: Basic", "Use: Quick tests"),
+    ("base", "~74 MB", "Speed: Fast", "Accuracy: Good", "Use: Real-time apps"), 
+    ("small", "~244 MB", "Speed: Medium", "Accuracy: Better", "Use: Balanced processing"),
+    ("medium", "~769 MB", "Speed: Slower", "Accuracy: High", "Use: Quality transcription"),
+    ("large-v3", "~1550 MB", "Speed: Slowest", "Accuracy: Best", "Use: Maximum quality")
+]
+
 def show_model_info():
     """Display information about available Whisper models"""
-    print(f"\n{Colors.BOLD}🤖 Available Whisper Models{Colors.END}")
-    print("─" * 80)
-    
-    models = [
-        ("tiny", "~39 MB", "Speed: Very Fast", "Accuracy: Basic", "Use: Quick tests"),
-        ("base", "~74 MB", "Speed: Fast", "Accuracy: Good", "Use: Real-time apps"), 
-        ("small", "~244 MB", "Speed: Medium", "Accuracy: Better", "Use: Balanced processing"),
-        ("medium", "~769 MB", "Speed: Slower", "Accuracy: High", "Use: Quality transcription"),
-        ("large-v3", "~1550 MB", "Speed: Slowest", "Accuracy: Best", "Use: Maximum quality")
-    ]
-    
-    for name, size, speed, accuracy, use_case in models:
-        print(f"{Colors.BOLD}{name:10}{Colors.END} | {size:8} | {speed:15} | {accuracy:15} | {use_case}")
+    # Assembled per call (colors may be disabled) and written with one print
+    lines = [f"\n{Colors.BOLD}🤖 Available Whisper Models{Colors.END}", "─" * 80]
+    lines += [f"{Colors.BOLD}{name:10}{Colors.END} | {size:8} | {speed:15} | {accuracy:15} | {use_case}"
+              for name, size, speed, accuracy, use_case in WHISPER_MODELS]
+    print("\n".join(lines))
+
+EXAMPLES = [
+    ("🚀 Quick Start (Interactive)", "video-transcribe --interactive"),
+    ("📁 Batch Process Directory", "video-transcribe run --input videos/ --output results/"),
+    ("🎯 High Quality Mode", "video-transcribe run --quality --input videos/ --output results/"),
+    ("⚡ Fast Testing Mode", "video-transcribe run --fast --input videos/ --output results/"),
+    ("🔍 Select Files Manually", "video-transcribe run --select --input videos/ --output results/"),
+    ("📄 Single File", "video-transcribe file --input myvideo.mp4"),
+    ("📂 Browse for File", "video-transcribe file --browse"),
+    ("🗣️  Spanish Language", "video-transcribe run --language es --input videos/ --output results/"),
+    ("🚫 Skip AI Summary", "video-transcribe run --no-summary --input videos/ --output results/"),
+    ("⚙️  Check Dependencies", "video-transcribe --check-deps"),
+]
 
 def show_examples():
     """Show practical usage examples"""
-    print(f"\n{Colors.BOLD}📚 Usage Examples{Colors.END}")
-    print("─" * 60)
-    
-    examples = [
-        ("🚀 Quick Start (Interactive)", "video-transcribe --interactive"),
-        ("📁 Batch Process Directory", "video-transcribe run --input videos/ --output results/"),
-        ("🎯 High Quality Mode", "video-transcribe run --quality --input videos/ --output results/"),
-        ("⚡ Fast Testing Mode", "video-transcribe run --fast --input videos/ --output results/"),
-        ("🔍 Select Files Manually", "video-transcribe run --select --input videos/ --output results/"),
-        ("📄 Single File", "video-transcribe file --input myvideo.mp4"),
-        ("📂 Browse for File", "video-transcribe file --browse"),
-        ("🗣️  Spanish Language", "video-transcribe run --language es --input videos/ --output results/"),
-        ("🚫 Skip AI Summary", "video-transcribe run --no-summary --input videos/ --output results/"),
-        ("⚙️  Check Dependencies", "video-transcribe --check-deps"),
-    ]
-    
-    for description, command in examples:
-        print(f"{Colors.GREEN}{description}{Colors.END}")
-        print(f"   {Colors.CYAN}{command}{Colors.END}\n")
+    lines = [f"\n{Colors.BOLD}📚 Usage Examples{Colors.END}", "─" * 60]
+    for description, command in EXAMPLES:
+        lines.append(f"{Colors.GREEN}{description}{Colors.END}")
+        lines.append(f"   {Colors.CYAN}{command}{Colors.END}\n")
+    print("\n".join(lines))
 
 def show_comprehensive_help():
     """Show detailed help information"""
@@ -991,8 +1751,6 @@ def show_comprehensive_help():
     show_model_info()
     show_examples()
     
-    print(f"{Colors.BOLD}💡 Pro Tips{Colors.END}")
-    print("─" * 60)
     tips = [
         "Use --interactive for first-time setup with guided configuration",
         "Save time with --quick preset for balanced speed/quality",
@@ -1002,35 +1760,135 @@ def show_comprehensive_help():
         "Files are automatically skipped if already processed",
         "Use Ctrl+C to safely interrupt processing (progress saved)"
     ]
-    
-    for tip in tips:
-        print(f"• {tip}")
-    
-    print(f"\n{Colors.BOLD}🔧 Configuration{Colors.END}")
-    print("─" * 60)
-    print("Configuration is automatically saved in:")
-    print(f"• macOS/Linux: ~/.config/video-transcribe/config.json")
-    print(f"• Windows: %APPDATA%/video-transcribe/config.json")
-    
-    print(f"\n{Colors.BOLD}📁 Output Files{Colors.END}")
-    print("─" * 60)
-    print("Each processed video generates:")
-    print("• transcript.txt - Timestamped transcript")
-    print("• captions.srt - SRT subtitle file") 
-    print("• captions.vtt - WebVTT caption file")
-    print("• full.txt - Plain text transcript")
-    print("• summary.md - AI-generated summary (if enabled)")
-    
-    print(f"\n{Colors.GREEN}For more help: {Colors.CYAN}video-transcribe <command> --help{Colors.END}")
-    print(f"{Colors.GREEN}Report issues: {Colors.CYAN}https://github.com/sejalsheth/integrate-with-tech/issues{Colors.END}")
-    print("=" * 70)
+    lines = [f"{Colors.BOLD}💡 Pro Tips{Colors.END}", "─" * 60]
+    lines += [f"• {tip}" for tip in tips]
+    lines += [
+        f"\n{Colors.BOLD}🔧 Configuration{Colors.END}",
+        "─" * 60,
+        "Configuration is automatically saved in:",
+        "• macOS/Linux: ~/.config/video-transcribe/config.json",
+        "• Windows: %APPDATA%/video-transcribe/config.json",
+        f"\n{Colors.BOLD}📁 Output Files{Colors.END}",
+        "─" * 60,
+        "Each processed video generates:",
+        "• transcript.txt - Timestamped transcript",
+        "• captions.srt - SRT subtitle file",
+        "• captions.vtt - WebVTT caption file",
+        "• full.txt - Plain text transcript",
+        "• summary.md - AI-generated summary (if enabled)",
+        f"\n{Colors.GREEN}For more help: {Colors.CYAN}video-transcribe <command> --help{Colors.END}",
+        f"{Colors.GREEN}Report issues: {Colors.CYAN}https://github.com/sejalsheth/integrate-with-tech/issues{Colors.END}",
+        "=" * 70,
+    ]
+    print("\n".join(lines))
 
 # --------------------------- cli ---------------------------
 
-def build_parser():
-    ap = argparse.ArgumentParser(
-        prog="video-transcribe",
-        description=f"""
+# Allowed --model / --compute-type values (tuples keep the help order)
+MODEL_SIZES = tuple(name for name, *_ in WHISPER_MODELS)
+COMPUTE_TYPES = ("auto", "int8", "int16", "float16", "int8_float16")
+
+# name -> (--help text, message when applied, settings it overrides)
+PRESETS = {
+    "quick": (
+        "Quick mode: small model, auto language, summaries enabled",
+        "🚀 Quick mode activated: small model, auto language, summaries enabled",
+        {"model": "small", "language": "auto", "summarizer": "bart", "compute_type": "auto"},
+    ),
+    "quality": (
+        "Quality mode: large-v3 model, slower but most accurate",
+        "🎯 Quality mode activated: large-v3 model, maximum accuracy",
+        {"model": "large-v3", "language": "auto", "summarizer": "bart", "compute_type": "auto", "beam": 5},
+    ),
+    "fast": (
+        "Fast mode: tiny model, good for testing",
+        "⚡ Fast mode activated: tiny model, no summaries",
+        {"model": "tiny", "language": "auto", "summarizer": "none", "compute_type": "auto", "beam": 1},
+    ),
+}
+
+def _add_preset_args(group):
+    for name, (help_text, _, _) in PRESETS.items():
+        group.add_argument(f"--{name}", action="store_true", help=help_text)
+
+def _add_model_args(group):
+    group.add_argument("--model", default="large-v3",
+                       choices=MODEL_SIZES,
+                       help="Whisper model size (default: large-v3)")
+    group.add_argument("--compute-type", default="auto",
+                       choices=COMPUTE_TYPES,
+                       help="Computation precision (default: auto = float16 on GPU, int8 on CPU)")
+    group.add_argument("--language", default="auto",
+                       help="Language code (en, es, fr, etc.) or 'auto' for detection")
+    group.add_argument("--beam", type=int, default=1,
+                       help="Beam size for decoding (default: 1 = greedy, higher=more accurate)")
+    group.add_argument("--batch-size", type=int, default=0,
+                       help="Audio windows decoded together per batch (0=auto: 16 on GPU, 8 on CPU; 1=unbatched)")
+    group.add_argument("--cpu-threads", type=int, default=0,
+                       help="CPU threads used by the model (default: 0 = all cores)")
+    group.add_argument("--num-workers", type=int, default=1,
+                       help="Model workers for concurrent transcriptions (default: 1)")
+    group.add_argument("--preconvert", action="store_true",
+                       help="Convert the model to --compute-type once and load the cached copy")
+
+def _add_trim_silence_arg(group):
+    group.add_argument("--trim-silence", action="store_true",
+                       help="Cut silence with ffmpeg instead of Whisper VAD (captions follow trimmed audio)")
+
+def _add_ai_args(group):
+    group.add_argument("--summarizer", choices=["bart", "none"], default="bart",
+                       help="AI summarization method (default: bart)")
+    group.add_argument("--summary-max", type=int, default=8,
+                       help="Maximum sentences in AI summary")
+    group.add_argument("--summary-model", default=DEFAULT_SUMMARY_MODEL,
+                       help=f"Hugging Face summarization model (default: {DEFAULT_SUMMARY_MODEL})")
+    group.add_argument("--summary-backend", default="torch", choices=["torch", "ct2"],
+                       help="Summarizer runtime: torch, or ct2 for an int8 CTranslate2 copy (default: torch)")
+    group.add_argument("--no-summary", action="store_true",
+                       help="Skip AI summary generation")
+
+def _add_run_args(run_cmd):
+    """Options of the batch `run` command"""
+    io_group = run_cmd.add_argument_group("📁 Input/Output")
+    io_group.add_argument("--input", "-i", required=True, 
+                         help="Directory containing media files to process (.mp4, .mkv, .m4a, .mov, .webm, .avi)")
+    io_group.add_argument("--output", "-o", required=True,
+                         help="Directory to save transcription outputs")
+    io_group.add_argument("--select", action="store_true",
+                         help="Interactively select which files to process")
+    _add_preset_args(run_cmd.add_argument_group("🚀 Quick Presets"))
+    _add_model_args(run_cmd.add_argument_group("🤖 Model Configuration"))
+    _add_ai_args(run_cmd.add_argument_group("🧠 AI Features"))
+    
+    proc_group = run_cmd.add_argument_group("⚙️  Processing Options")
+    proc_group.add_argument("--timeout", type=int, default=0,
+                          help="Per-file timeout in seconds (0=unlimited)")
+    proc_group.add_argument("--retries", type=int, default=2,
+                          help="Retry attempts for failed files")
+    proc_group.add_argument("--progress-timeout", type=int, default=180,
+                          help="Abort if no progress for N seconds")
+    _add_trim_silence_arg(proc_group)
+    proc_group.add_argument("--parallel", "--jobs", type=int, default=1,
+                          help="Files processed in parallel, each worker on its own cores (and GPU, round-robin) with its own model copy")
+
+def _add_file_args(file_cmd):
+    """Options of the single-file `file` command"""
+    file_io_group = file_cmd.add_argument_group("📁 Input/Output")
+    file_io_group.add_argument("--input", "-i", required=True,
+                              help="Video file to transcribe")
+    file_io_group.add_argument("--output", "-o", 
+                              help="Output directory (default: same as input file)")
+    file_io_group.add_argument("--browse", action="store_true",
+                              help="Browse and select input file interactively")
+    file_model_group = file_cmd.add_argument_group("🤖 Model Configuration")
+    _add_model_args(file_model_group)
+    _add_trim_silence_arg(file_model_group)
+    _add_ai_args(file_cmd.add_argument_group("🧠 AI Features"))
+    _add_preset_args(file_cmd.add_argument_group("🚀 Quick Presets"))
+
+def parser_description() -> str:
+    """Top-level --help description"""
+    return f"""
 {Colors.BOLD}🎥 Video Transcription Console Tool{Colors.END}
 
 AI-powered batch transcription using OpenAI Whisper + Facebook BART summarization.
@@ -1042,7 +1900,18 @@ Converts MP4 videos to accurate text transcripts with optional AI summaries.
 • Multiple output formats (SRT, VTT, TXT, MD)
 • Robust batch processing with resume capability
 • Real-time progress tracking and error recovery
-        """,
+        """
+
+def build_parser(argv: Optional[List[str]] = None):
+    """
+    Build the CLI parser. With argv, only the command named in it gets its
+    options attached, so --help/--version and global flags skip the rest.
+    """
+    # The colored description only shows in --help; skip building it otherwise
+    wants_help = argv is None or "-h" in argv or "--help" in argv
+    ap = argparse.ArgumentParser(
+        prog="video-transcribe",
+        description=parser_description() if wants_help else None,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
     
@@ -1063,7 +1932,7 @@ Converts MP4 videos to accurate text transcripts with optional AI summaries.
     run_cmd = sub.add_parser(
         "run", 
         help="Start batch transcription",
-        description=f"{Colors.BOLD}Batch Transcription Mode{Colors.END}\n\nProcess all MP4 files in input directory."
+        description=f"{Colors.BOLD}Batch Transcription Mode{Colors.END}\n\nProcess all media files in input directory."
     )
     
     # File command (single file processing)
@@ -1073,206 +1942,122 @@ Converts MP4 videos to accurate text transcripts with optional AI summaries.
         description=f"{Colors.BOLD}Single File Mode{Colors.END}\n\nTranscribe one specific video file."
     )
     
-    # Input/Output for batch mode
-    io_group = run_cmd.add_argument_group("📁 Input/Output")
-    io_group.add_argument("--input", "-i", required=True, 
-                         help="Directory containing MP4 files to process")
-    io_group.add_argument("--output", "-o", required=True,
-                         help="Directory to save transcription outputs")
-    io_group.add_argument("--select", action="store_true",
-                         help="Interactively select which files to process")
-    
-    # Input/Output for single file mode
-    file_io_group = file_cmd.add_argument_group("📁 Input/Output")
-    file_io_group.add_argument("--input", "-i", required=True,
-                              help="Video file to transcribe")
-    file_io_group.add_argument("--output", "-o", 
-                              help="Output directory (default: same as input file)")
-    file_io_group.add_argument("--browse", action="store_true",
-                              help="Browse and select input file interactively")
-    
-    # Quick presets
-    preset_group = run_cmd.add_argument_group("🚀 Quick Presets")
-    preset_group.add_argument("--quick", action="store_true",
-                             help="Quick mode: small model, auto language, summaries enabled")
-    preset_group.add_argument("--quality", action="store_true", 
-                             help="Quality mode: large-v3 model, slower but most accurate")
-    preset_group.add_argument("--fast", action="store_true",
-                             help="Fast mode: tiny model, good for testing")
-    
-    # Model configuration  
-    model_group = run_cmd.add_argument_group("🤖 Model Configuration")
-    model_group.add_argument("--model", default="large-v3",
-                           choices=["tiny", "base", "small", "medium", "large-v3"],
-                           help="Whisper model size (default: large-v3)")
-    model_group.add_argument("--compute-type", default="int8",
-                           choices=["auto", "int8", "int16", "float16", "int8_float16"],
-                           help="Computation precision (default: int8)")
-    model_group.add_argument("--language", default="auto",
-                           help="Language code (en, es, fr, etc.) or 'auto' for detection")
-    model_group.add_argument("--beam", type=int, default=5,
-                           help="Beam size for decoding (1-10, higher=more accurate)")
-    
-    # AI features
-    ai_group = run_cmd.add_argument_group("🧠 AI Features") 
-    ai_group.add_argument("--summarizer", choices=["bart", "none"], default="bart",
-                         help="AI summarization method (default: bart)")
-    ai_group.add_argument("--summary-max", type=int, default=8,
-                         help="Maximum sentences in AI summary")
-    ai_group.add_argument("--no-summary", action="store_true",
-                         help="Skip AI summary generation")
-    
-    # Processing options
-    proc_group = run_cmd.add_argument_group("⚙️  Processing Options")
-    proc_group.add_argument("--timeout", type=int, default=0,
-                          help="Per-file timeout in seconds (0=unlimited)")
-    proc_group.add_argument("--retries", type=int, default=2,
-                          help="Retry attempts for failed files")
-    proc_group.add_argument("--progress-timeout", type=int, default=180,
-                          help="Abort if no progress for N seconds")
-    proc_group.add_argument("--parallel", type=int, default=1,
-                          help="Number of files to process in parallel (experimental)")
+    if argv is None:
+        wanted = {"run", "file"}
+    else:
+        wanted = {next((a for a in argv if not a.startswith("-")), None)}
+    if "run" in wanted:
+        _add_run_args(run_cmd)
+    if "file" in wanted:
+        _add_file_args(file_cmd)
     
-    # Copy model configuration to single file mode
-    file_model_group = file_cmd.add_argument_group("🤖 Model Configuration")
-    file_model_group.add_argument("--model", default="large-v3",
-                                 choices=["tiny", "base", "small", "medium", "large-v3"],
-                                 help="Whisper model size (default: large-v3)")
-    file_model_group.add_argument("--compute-type", default="int8",
-                                 choices=["auto", "int8", "int16", "float16", "int8_float16"],
-                                 help="Computation precision (default: int8)")
-    file_model_group.add_argument("--language", default="auto",
-                                 help="Language code (en, es, fr, etc.) or 'auto' for detection")
-    file_model_group.add_argument("--beam", type=int, default=5,
-                                 help="Beam size for decoding (1-10, higher=more accurate)")
-    
-    # Copy AI features to single file mode  
-    file_ai_group = file_cmd.add_argument_group("🧠 AI Features")
-    file_ai_group.add_argument("--summarizer", choices=["bart", "none"], default="bart",
-                              help="AI summarization method (default: bart)")
-    file_ai_group.add_argument("--summary-max", type=int, default=8,
-                              help="Maximum sentences in AI summary")
-    file_ai_group.add_argument("--no-summary", action="store_true",
-                              help="Skip AI summary generation")
-    
-    # Copy presets to single file mode
-    file_preset_group = file_cmd.add_argument_group("🚀 Quick Presets")
-    file_preset_group.add_argument("--quick", action="store_true",
-                                  help="Quick mode: small model, auto language, summaries enabled")
-    file_preset_group.add_argument("--quality", action="store_true", 
-                                  help="Quality mode: large-v3 model, slower but most accurate")
-    file_preset_group.add_argument("--fast", action="store_true",
-                                  help="Fast mode: tiny model, good for testing")
-    
-    # Single file mode (internal)
-    single_cmd = sub.add_parser("single", help=argparse.SUPPRESS)
-    single_cmd.add_argument("--input-file", required=True)
-    single_cmd.add_argument("--output-root", required=True)
-    single_cmd.add_argument("--model", required=True)
-    single_cmd.add_argument("--compute-type", required=True)
-    single_cmd.add_argument("--language", required=True)
-    single_cmd.add_argument("--beam", type=int, required=True)
-    single_cmd.add_argument("--summarizer", choices=["bart", "none"], required=True)
-    single_cmd.add_argument("--summary-max", type=int, required=True)
-    single_cmd.add_argument("--progress-timeout", type=int, required=True)
-
     return ap
 
 def apply_preset(args):
-    """Apply quick preset configurations"""
-    if hasattr(args, 'quick') and args.quick:
-        args.model = "small"
-        args.language = "auto" 
-        args.summarizer = "bart"
-        args.compute_type = "int8"
-        print(f"{Colors.GREEN}🚀 Quick mode activated: small model, auto language, summaries enabled{Colors.END}")
-    
-    elif hasattr(args, 'quality') and args.quality:
-        args.model = "large-v3"
-        args.language = "auto"
-        args.summarizer = "bart"
-        args.compute_type = "int8"
-        args.beam = 5
-        print(f"{Colors.GREEN}🎯 Quality mode activated: large-v3 model, maximum accuracy{Colors.END}")
-    
-    elif hasattr(args, 'fast') and args.fast:
-        args.model = "tiny"
-        args.language = "auto"
-        args.summarizer = "none"
-        args.compute_type = "int8"
-        args.beam = 1
-        print(f"{Colors.GREEN}⚡ Fast mode activated: tiny model, no summaries{Colors.END}")
+    """Apply the first selected quick preset (see PRESETS)"""
+    for name, (_, message, settings) in PRESETS.items():
+        if getattr(args, name, False):
+            vars(args).update(settings)
+            print(f"{Colors.GREEN}{message}{Colors.END}")
+            break
     
-    if hasattr(args, 'no_summary') and args.no_summary:
+    if getattr(args, 'no_summary', False):
         args.summarizer = "none"
 
+def print_welcome():
+    """Getting-started screen shown when run without arguments, written in one go"""
+    sys.stdout.write("\n".join([
+        banner_text(),
+        f"\n{Colors.YELLOW}💡 Welcome! Here's how to get started:{Colors.END}\n",
+        f"{Colors.BOLD}🚀 Quick Start:{Colors.END}",
+        f"  {Colors.CYAN}video-transcribe --interactive{Colors.END}     # Interactive setup wizard",
+        f"  {Colors.CYAN}video-transcribe --check-deps{Colors.END}      # Verify your system is ready",
+        f"  {Colors.CYAN}video-transcribe file --browse{Colors.END}     # Browse and select a video file",
+        f"\n{Colors.BOLD}📚 Learning & Help:{Colors.END}",
+        f"  {Colors.CYAN}video-transcribe --guide{Colors.END}          # Comprehensive usage guide",
+        f"  {Colors.CYAN}video-transcribe --examples{Colors.END}       # Show practical examples",
+        f"  {Colors.CYAN}video-transcribe --models{Colors.END}         # Available AI models info",
+        f"  {Colors.CYAN}video-transcribe --help{Colors.END}           # Full command reference",
+        f"\n{Colors.BOLD}⚙️  Configuration:{Colors.END}",
+        f"  {Colors.CYAN}video-transcribe --show-config{Colors.END}    # View saved settings",
+        f"  {Colors.CYAN}video-transcribe --reset-config{Colors.END}   # Reset to defaults",
+        f"\n{Colors.GREEN}💡 Tip: Start with {Colors.BOLD}--interactive{Colors.END}{Colors.GREEN} for guided setup!{Colors.END}\n",
+    ]))
+    sys.stdout.flush()
+
+def validate_io_args(args) -> bool:
+    """Check run-mode paths: input is a directory with media files, output is creatable"""
+    in_dir = Path(args.input)
+    if not in_dir.is_dir():
+        print(f"{Colors.RED}❌ Error: Input directory not found: {in_dir.resolve()}{Colors.END}")
+        return False
+    if not find_media_files(in_dir):
+        print(f"{Colors.YELLOW}⚠️  No media files found in {in_dir.resolve()}{Colors.END}")
+        print(f"{Colors.CYAN}💡 Supported formats: {', '.join(MEDIA_EXTS)}{Colors.END}")
+        return False
+    # The output directory may not exist yet: check its nearest existing ancestor
+    out = Path(args.output).resolve()
+    while not out.exists() and out.parent != out:
+        out = out.parent
+    if not os.access(out, os.W_OK):
+        print(f"{Colors.RED}❌ Error: Output directory is not writable: {out}{Colors.END}")
+        return False
+    return True
+
+def check_deps():
+    """--check-deps: full dependency and hardware report"""
+    if validate_dependencies(system=True):
+        print(f"\n{Colors.GREEN}✅ All dependencies satisfied!{Colors.END}")
+    else:
+        print(f"\n{Colors.RED}❌ Missing dependencies. Please install them first.{Colors.END}")
+
+def reset_config():
+    """--reset-config: delete the saved configuration"""
+    config_path = get_config_path()
+    if config_path.exists():
+        config_path.unlink()
+        _read_config.cache_clear()
+        print(f"{Colors.GREEN}✅ Configuration reset successfully{Colors.END}")
+    else:
+        print(f"{Colors.YELLOW}ℹ️  No configuration file to reset{Colors.END}")
+
+# Global flags that print something and exit, checked in this order
+GLOBAL_ACTIONS = {
+    "check_deps": check_deps,
+    "show_config": show_config,
+    "reset_config": reset_config,
+    "guide": show_comprehensive_help,
+    "models": show_model_info,
+    "examples": show_examples,
+}
+
 def main():
     """Enhanced main function with better UX"""
-    ap = build_parser()
-    
+    # Persistent worker spawned by the controller (internal); settings arrive on stdin
+    if sys.argv[1:] == ["serve"]:
+        sys.exit(serve())
+
+    # Handle color disabling before anything (parser help included) is formatted;
+    # non-TTY output and NO_COLOR are already handled at import
+    if "--no-color" in sys.argv[1:]:
+        Colors.disable()
+
     # Handle no arguments - show help
     if len(sys.argv) == 1:
-        print_banner()
-        print(f"\n{Colors.YELLOW}💡 Welcome! Here's how to get started:{Colors.END}\n")
-        
-        print(f"{Colors.BOLD}🚀 Quick Start:{Colors.END}")
-        print(f"  {Colors.CYAN}video-transcribe --interactive{Colors.END}     # Interactive setup wizard")
-        print(f"  {Colors.CYAN}video-transcribe --check-deps{Colors.END}      # Verify your system is ready")
-        print(f"  {Colors.CYAN}video-transcribe file --browse{Colors.END}     # Browse and select a video file")
-        
-        print(f"\n{Colors.BOLD}📚 Learning & Help:{Colors.END}")
-        print(f"  {Colors.CYAN}video-transcribe --guide{Colors.END}          # Comprehensive usage guide")
-        print(f"  {Colors.CYAN}video-transcribe --examples{Colors.END}       # Show practical examples")
-        print(f"  {Colors.CYAN}video-transcribe --models{Colors.END}         # Available AI models info")
-        print(f"  {Colors.CYAN}video-transcribe --help{Colors.END}           # Full command reference")
-        
-        print(f"\n{Colors.BOLD}⚙️  Configuration:{Colors.END}")
-        print(f"  {Colors.CYAN}video-transcribe --show-config{Colors.END}    # View saved settings")
-        print(f"  {Colors.CYAN}video-transcribe --reset-config{Colors.END}   # Reset to defaults")
-        
-        print(f"\n{Colors.GREEN}💡 Tip: Start with {Colors.BOLD}--interactive{Colors.END}{Colors.GREEN} for guided setup!{Colors.END}")
+        print_welcome()
         sys.exit(0)
+
+    ap = build_parser(sys.argv[1:])
     
     args = ap.parse_args()
     
-    # Handle color disabling
-    if hasattr(args, 'no_color') and args.no_color:
-        Colors.disable()
-    
     # Handle global options
-    if hasattr(args, 'check_deps') and args.check_deps:
-        if validate_dependencies():
-            print(f"\n{Colors.GREEN}✅ All dependencies satisfied!{Colors.END}")
-        else:
-            print(f"\n{Colors.RED}❌ Missing dependencies. Please install them first.{Colors.END}")
-        sys.exit(0)
-    
-    if hasattr(args, 'show_config') and args.show_config:
-        show_config()
-        sys.exit(0)
-    
-    if hasattr(args, 'reset_config') and args.reset_config:
-        config_path = get_config_path()
-        if config_path.exists():
-            config_path.unlink()
-            print(f"{Colors.GREEN}✅ Configuration reset successfully{Colors.END}")
-        else:
-            print(f"{Colors.YELLOW}ℹ️  No configuration file to reset{Colors.END}")
-        sys.exit(0)
-    
-    if hasattr(args, 'guide') and args.guide:
-        show_comprehensive_help()
-        sys.exit(0)
-        
-    if hasattr(args, 'models') and args.models:
-        show_model_info()
-        sys.exit(0)
-        
-    if hasattr(args, 'examples') and args.examples:
-        show_examples()
-        sys.exit(0)
+    for flag, action in GLOBAL_ACTIONS.items():
+        if getattr(args, flag):
+            action()
+            sys.exit(0)
     
-    if hasattr(args, 'interactive') and args.interactive:
+    if args.interactive:
         if not validate_dependencies():
             print(f"\n{Colors.RED}❌ Please install missing dependencies first.{Colors.END}")
             sys.exit(1)
@@ -1287,21 +2072,29 @@ def main():
         args.language = config["language"]
         args.summarizer = config["summarizer"]
         # Use defaults for other settings
-        args.compute_type = "int8"
-        args.beam = 5
+        args.compute_type = "auto"
+        args.beam = 1
+        args.batch_size = 0
+        args.cpu_threads = 0
+        args.num_workers = 1
+        args.trim_silence = False
+        args.preconvert = False
         args.timeout = 0
         args.retries = 2
         args.progress_timeout = 180
         args.summary_max = 8
-    
-    # Handle single file mode (internal)
-    if args.mode == "single":
-        sys.exit(worker(args))
+        args.summary_model = DEFAULT_SUMMARY_MODEL
+        args.summary_backend = "torch"
+        args.parallel = 1
     
     # Handle run mode
-    elif args.mode == "run":
+    if args.mode == "run":
+        # Cheap path checks first, so a typo doesn't wait on the dependency check
+        if not validate_io_args(args):
+            sys.exit(1)
+        
         # Validate dependencies for run mode
-        if not hasattr(args, 'interactive') or not args.interactive:
+        if not args.interactive:
             if not validate_dependencies():
                 print(f"\n{Colors.RED}❌ Missing dependencies. Run with --check-deps for details.{Colors.END}")
                 sys.exit(1)